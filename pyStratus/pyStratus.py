@@ -18,13 +18,43 @@ import os
 import sys
 import requests
 import ttkbootstrap as tb
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from PIL import Image, ImageTk
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from requests.exceptions import RequestException, HTTPError
-from tkinter import Toplevel, messagebox, filedialog, StringVar
+from tkinter import Toplevel, messagebox, filedialog, StringVar, IntVar, BooleanVar, TclError
 import time
 import random
 import logging
+import queue
+import threading
+import json
+import math
+import hashlib
+import base64
+import asyncio
+import sqlite3
+import shutil
+import zipfile
+import io
+import uuid
+import mimetypes
+import shlex
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import httpx  # Optional: lets the async client multiplex requests without threads
+except ImportError:
+    httpx = None
+
+try:
+    from tkinterdnd2 import DND_FILES, TkinterDnD  # Optional: drop files/folders onto attachment tables
+except ImportError:
+    TkinterDnD = None
 
 # DPI awareness (Windows only) - must be set before any Tkinter code
 if sys.platform == "win32":
@@ -40,6 +70,7 @@ logging.basicConfig(level=logging.INFO)
 
 # API configuration
 BASE_URL = "https://api.gtpstratus.com"
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
 APPKEY_FILE = "appkey.txt"
 ENDPOINTS = {
     "project": "/v2/project",
@@ -51,9 +82,98 @@ ENDPOINTS = {
 
 PAGE_SIZE = 1000
 
+# Shared HTTP session
+HTTP_POOL_SIZE = 32  # Keep-alive connections kept per host
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+ASYNC_MAX_CONNECTIONS = 64  # httpx connection limit for the async client
+
+# Client-side rate limit shared by every thread and the async loop
+RATE_LIMIT_PER_SECOND = 10
+RATE_LIMIT_BURST = 20
+RATE_STATUS_REFRESH_MS = 500
+
+# On-disk cache for GET responses that rarely change
+RESPONSE_CACHE_FILE = "response_cache.sqlite3"
+RESPONSE_CACHE_TTLS = {  # Seconds a cached response is served without asking the API, by path
+    ENDPOINTS["project"]: 15 * 60,
+    ENDPOINTS["user"]: 60 * 60,
+    "/v1/container": 60 * 60,
+    "/v1/company/tracking-statuses": 24 * 60 * 60,
+}
+
+# Local package store: re-selecting a project only fetches packages modified since the last sync
+PACKAGE_STORE_FILE = "package_store.sqlite3"
+PACKAGE_FULL_SYNC_INTERVAL = 24 * 60 * 60  # Seconds; full syncs also drop packages deleted on the server
+
+# In-memory cache of attachment listings for recently viewed packages/assemblies
+ATTACHMENT_CACHE_SIZE = 256
+ATTACHMENT_CACHE_TTL = 120  # Seconds
+
+# Attachment downloads run on their own pool so they never starve API calls
+DOWNLOAD_WORKERS = 4  # Default files downloaded in parallel; adjustable in the Downloads window
+MAX_DOWNLOAD_WORKERS = 16
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_PROGRESS_MS = 100  # Minimum interval between progress updates for one file
+DOWNLOAD_RETRIES = 5  # Attempts per file; each one resumes from the bytes already in the .part file
+
+# Attachment uploads stream from disk; the read timeout grows with the file size
+UPLOAD_MIN_BYTES_PER_SECOND = 256 * 1024
+UPLOAD_RETRIES = 3
+UPLOAD_QUEUE_FILE = "upload_queue.json"  # Uploads still pending when the app closed resume on the next start
+UPLOAD_MANIFEST_FILE = "upload_manifest.json"  # Size/hash of files last uploaded, for skipping unchanged files
+
+# Content-addressed copies of downloaded attachments, reused instead of downloading again
+ATTACHMENT_STORE_DIR = "attachment_store"
+ATTACHMENT_STORE_MAX_BYTES = 2 * 1024 ** 3  # Least recently used files are evicted above this
+
+# Whole-project export: project/package/assembly folder tree
+EXPORT_MANIFEST_FILE = "export_manifest.json"
+EXPORT_LISTING_CONCURRENCY = 8  # Attachment/assembly listings in flight at once
+
+# Non-modal error reporting
+NOTIFICATION_POLL_MS = 200
+NOTIFICATION_HISTORY = 200
+NOTIFICATION_COLORS = {"error": "red", "warning": "orange", "info": "gray"}
+
+# Background API workers
+WORKER_THREADS = 8
+UI_POLL_MS = 50
+ASSEMBLY_COUNT_CONCURRENCY = 8  # Max assembly-count requests in flight at once
+
+# Assembly counts are cached on disk and only fetched for rows scrolled into view
+ASSEMBLY_COUNT_CACHE_FILE = "assembly_counts.json"
+ASSEMBLY_COUNT_TTL = 7 * 24 * 60 * 60  # Seconds before a cached count is discarded
+COUNT_SCROLL_DEBOUNCE_MS = 150
+MAX_VISIBLE_COUNT_ROWS = 100
+
+# Large tables are filled across several after() ticks so the UI keeps painting
+TABLE_FIRST_BATCH = 200  # Rows merged immediately so the first screen appears at once
+TABLE_BATCH_MS = 15  # Time budget per tick for the remaining rows
+
+# Filter boxes wait for a pause in typing, then search a word index
+FILTER_DEBOUNCE_MS = 150
+SEARCH_FIELDS = {"name": 1.0, "number": 1.0, "categoryId": 0.8, "description": 0.6}  # Indexed field -> rank weight
+SEARCH_FIELD_ALIASES = {"name": "name", "number": "number", "num": "number", "no": "number",
+                        "desc": "description", "description": "description",
+                        "cat": "categoryId", "category": "categoryId"}  # Query prefix, e.g. desc:hanger
+SEARCH_FUZZY_MIN_LENGTH = 4  # Shorter terms are not typo-matched; one edit away covers too many words
+SEARCH_FUZZY_LONG = 8  # Terms this long may be two typos (edits or swapped letters) off a word, shorter ones one
+SEARCH_RANK_LIMIT = 2000  # Larger result sets keep list order instead of being ranked
+
+# Notebook tabs whose data is fetched lazily, by tab text
+LAZY_TABS = {
+    "Activity Logs": "activity_logs",
+    "Users": "users",
+    "Containers": "containers",
+    "API Health": "health",
+    "Tracking Statuses": "tracking_statuses",
+}
+
 NO_FILE_SELECTED = "No File Selected"
 NO_PACKAGE_SELECTED = "No Package Selected"
 NO_ASSEMBLY_SELECTED = "No Assembly Selected"
+NO_PROJECT_SELECTED = "No Project Selected"
 
 def get_api_key(root):
     """Retrieve or prompt for API key and save it to appkey.txt."""
@@ -109,32 +229,281 @@ def get_api_key(root):
     messagebox.showerror("Error", "No app key provided. Exiting.")
     exit(1)
 
+# Callbacks queued by worker threads, drained on the Tk thread by ApiDispatcher
+_ui_queue = queue.Queue()
+_job_context = threading.local()
+# Notifications for the status bar, drained on the Tk thread by StratusGUI
+_notification_queue = queue.Queue()
+
+def run_on_ui_thread(func, *args):
+    """Schedule func(*args) on the Tk thread. Safe to call from any thread."""
+    _ui_queue.put((func, args))
+
+def job_cancelled():
+    """Return True if the background job running on this thread has been superseded."""
+    job = getattr(_job_context, "job", None)
+    return job is not None and job.cancelled.is_set()
+
+def notify(level, title, message):
+    """Queue a non-blocking notification ("error", "warning" or "info") for the status bar.
+
+    Safe to call from any thread; never blocks on the UI.
+    """
+    _notification_queue.put((level, title, message, time.time()))
+
+class NotificationLog:
+    """Recent notifications, with repeats of the same message collapsed into a count."""
+    def __init__(self, limit=NOTIFICATION_HISTORY):
+        self.limit = limit
+        self.entries = OrderedDict()  # (level, title, message) -> entry dict
+
+    def add(self, level, title, message, timestamp):
+        key = (level, title, message)
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            entry = {"level": level, "title": title, "message": message, "count": 0, "first": timestamp}
+        entry["count"] += 1
+        entry["last"] = timestamp
+        self.entries[key] = entry  # Most recent last
+        while len(self.entries) > self.limit:
+            self.entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+class RateLimiter:
+    """Process-wide token bucket with a global back-off for 429 responses.
+
+    Every request takes a token first. A Retry-After pauses all callers rather
+    than only the request that received it, so concurrent fetches slow down
+    together.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before sending."""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.blocked_until)
+            if start > self.updated:
+                self.tokens = min(self.burst, self.tokens + (start - self.updated) * self.rate)
+                self.updated = start
+            self.tokens -= 1
+            ready = self.updated + max(0.0, -self.tokens) / self.rate
+            return max(0.0, ready - now)
+
+    def backoff(self, seconds):
+        """Pause every caller for at least `seconds` (e.g. a Retry-After header)."""
+        with self.lock:
+            until = time.monotonic() + seconds
+            if until > self.blocked_until:
+                self.blocked_until = until
+                self.tokens = min(self.tokens, 0.0)
+                self.updated = max(self.updated, until)
+
+    def acquire(self):
+        time.sleep(self.reserve())
+        # A back-off that started while we were waiting still applies
+        remaining = self.blocked_until - time.monotonic()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = self.blocked_until - time.monotonic()
+
+    async def acquire_async(self):
+        await asyncio.sleep(self.reserve())
+        remaining = self.blocked_until - time.monotonic()
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            remaining = self.blocked_until - time.monotonic()
+
+    def state(self):
+        """Return (available tokens, seconds left in the current back-off)."""
+        with self.lock:
+            now = time.monotonic()
+            blocked_for = max(0.0, self.blocked_until - now)
+            tokens = self.tokens
+            if not blocked_for and now > self.updated:
+                tokens = min(self.burst, tokens + (now - self.updated) * self.rate)
+            return tokens, blocked_for
+
+RATE_LIMITER = RateLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+
+def retry_after_seconds(response):
+    """Seconds a 429 response asks us to wait: Retry-After as seconds or an HTTP-date, else 60."""
+    value = response.headers.get("Retry-After", "").strip()
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        return max(0, int((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()))
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return 60
+
+def run_transfer(attempt, retries, cancelled=None):
+    """Call attempt() until it returns a status; return (status, error).
+
+    Dropped connections and 5xx responses are retried with exponential back-off,
+    a 429 pauses every caller through RATE_LIMITER for Retry-After, and any other
+    4xx gives up at once. Other exceptions propagate to the caller. The status is
+    "Cancelled" when cancelled is set after a failed attempt and "Failed" when the
+    retries run out.
+    """
+    error = None
+    for number in range(retries):
+        try:
+            return attempt(), None
+        except HTTPError as e:
+            error = e
+            if e.response.status_code == 429:
+                RATE_LIMITER.backoff(retry_after_seconds(e.response) + random.uniform(0, 0.1))
+            elif e.response.status_code < 500:
+                break
+        except RequestException as e:
+            error = e
+        if cancelled is not None and cancelled.is_set():
+            return "Cancelled", None
+        time.sleep(min(2 ** number, 10) + random.uniform(0, 0.1))
+    return "Failed", error
+
 def handle_request_error(e, action):
     """Centralized error handling for HTTP requests."""
     logging.error(f"{action} failed: {e}", exc_info=True)
     if isinstance(e, HTTPError) and e.response.status_code == 429:
-        retry_after = int(e.response.headers.get("Retry-After", 60))
-        messagebox.showwarning("Rate Limit", f"Rate limit exceeded for {action}. Retry after {retry_after} seconds.")
+        retry_after = retry_after_seconds(e.response)
+        notify("warning", "Rate Limit", f"Rate limit exceeded for {action}. Retry after {retry_after} seconds.")
         return retry_after
     elif isinstance(e, HTTPError):
-        messagebox.showerror("Error", f"{action}: {e}\nResponse: {e.response.text}")
+        notify("error", "Error", f"{action}: {e}\nResponse: {e.response.text}")
     elif isinstance(e, requests.exceptions.ConnectionError):
-        messagebox.showerror("Error", "Connection failed. Check internet, VPN, or proxy settings.")
+        notify("error", "Error", "Connection failed. Check internet, VPN, or proxy settings.")
     else:
-        messagebox.showerror("Error", f"{action}: {e}")
+        notify("error", "Error", f"{action}: {e}")
     return None
 
-def make_api_request(url, headers, params, action, retries=3, backoff_factor=1):
-    """Make an API request with retry logic for transient errors."""
+class CachedResponse:
+    """The parts of requests.Response that callers use, rebuilt from a cache row."""
+    def __init__(self, url, content, etag=None, last_modified=None):
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.headers = CaseInsensitiveDict(
+            {k: v for k, v in (("ETag", etag), ("Last-Modified", last_modified)) if v})
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+class ResponseCache:
+    """SQLite cache of GET responses keyed by URL and query parameters.
+
+    Only paths listed in `ttls` are cached. Within its TTL an entry is served
+    without a request; after that it is revalidated with If-None-Match /
+    If-Modified-Since so an unchanged resource costs a 304 rather than a download.
+    """
+    def __init__(self, path, ttls=RESPONSE_CACHE_TTLS):
+        self.ttls = ttls
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS responses ("
+                              "key TEXT PRIMARY KEY, url TEXT, body BLOB, etag TEXT, last_modified TEXT, stored REAL)")
+
+    def ttl_for(self, url):
+        return self.ttls.get(urlsplit(url).path)
+
+    @staticmethod
+    def key(url, params):
+        return f"{url}?{urlencode(sorted((k, str(v)) for k, v in (params or {}).items()))}"
+
+    def get(self, key):
+        """Return (CachedResponse, age in seconds) or None."""
+        try:
+            with self.lock:
+                row = self.conn.execute("SELECT url, body, etag, last_modified, stored FROM responses WHERE key = ?",
+                                        (key,)).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        url, body, etag, last_modified, stored = row
+        return CachedResponse(url, body, etag, last_modified), time.time() - stored
+
+    def put(self, key, response):
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                                  (key, response.url, response.content, response.headers.get("ETag"),
+                                   response.headers.get("Last-Modified"), time.time()))
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache write failed: {e}")
+
+    def touch(self, key):
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("UPDATE responses SET stored = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache write failed: {e}")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def make_api_request(url, headers, params, action, retries=3, backoff_factor=1, session=None,
+                     timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), cache=None, revalidate=False):
+    """Make an API request with retry logic for transient errors.
+
+    With a ResponseCache, cacheable URLs are answered from disk while fresh (unless
+    revalidate is set) and otherwise fetched with a conditional request.
+    """
+    http = session or requests
+    ttl = cache.ttl_for(url) if cache is not None else None
+    cached = None
+    if ttl is not None:
+        cache_key = cache.key(url, params)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            cached, age = entry
+            if age < ttl and not revalidate:
+                return cached
+            headers = dict(headers or {})
+            if cached.headers.get("ETag"):
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if cached.headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            RATE_LIMITER.acquire()
+            response = http.get(url, headers=headers, params=params, timeout=timeout)
+            if cached is not None and response.status_code == 304:
+                cache.touch(cache_key)
+                return cached
             response.raise_for_status()
+            if ttl is not None:
+                cache.put(cache_key, response)
             return response
         except RequestException as e:
             retry_after = handle_request_error(e, action)
-            if retry_after is not None:  # 429 Rate Limit
-                time.sleep(retry_after + random.uniform(0, 0.1))  # Jitter
+            if retry_after is not None:  # 429 Rate Limit: every caller waits it out in RATE_LIMITER.acquire
+                RATE_LIMITER.backoff(retry_after + random.uniform(0, 0.1))  # Jitter
                 continue
             elif isinstance(e, HTTPError) and e.response.status_code in (500, 503):  # Transient errors
                 if attempt < retries - 1:
@@ -144,18 +513,1225 @@ def make_api_request(url, headers, params, action, retries=3, backoff_factor=1):
             raise e
     raise RequestException(f"Failed to complete {action} after {retries} attempts")
 
+class StratusClient:
+    """HTTP client for the Stratus API backed by one pooled keep-alive session."""
+    def __init__(self, app_key, pool_size=HTTP_POOL_SIZE, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), cache=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update({"app-key": app_key, "Accept": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def get(self, url, params, action, **kwargs):
+        """GET with the retry/back-off behaviour of make_api_request."""
+        return make_api_request(url, None, params, action, session=self.session, timeout=self.timeout,
+                                cache=self.cache, **kwargs)
+
+    def request(self, method, url, timeout=None, **kwargs):
+        RATE_LIMITER.acquire()
+        return self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+class AsyncStratusClient:
+    """Asyncio counterpart of StratusClient for bulk work on the dispatcher's event loop.
+
+    Uses httpx.AsyncClient when httpx is installed. Otherwise each request runs on
+    the shared requests session in the loop's executor, so callers can still await
+    it. Errors are raised as requests exceptions either way, so handle_request_error
+    and the retry rules behave exactly as in make_api_request.
+    """
+    def __init__(self, client, max_connections=ASYNC_MAX_CONNECTIONS):
+        self.client = client
+        self.max_connections = max_connections
+        self._http = None
+        self._loop = None
+
+    async def _send(self, url, params):
+        # requests sends booleans as "True"/"False"; keep the query strings identical
+        params = {k: str(v) if isinstance(v, bool) else v for k, v in (params or {}).items()}
+        if httpx is None:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None, lambda: self.client.session.request("GET", url, params=params, timeout=self.client.timeout))
+            response.raise_for_status()
+            return response
+        if self._http is None:
+            self._loop = asyncio.get_running_loop()
+            self._http = httpx.AsyncClient(
+                headers=dict(self.client.headers),
+                timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections))
+        try:
+            response = await self._http.get(url, params=params)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        if response.is_error:
+            raise HTTPError(f"{response.status_code} Error: {response.reason_phrase} for url: {response.url}",
+                            response=response)
+        return response
+
+    async def get(self, url, params, action, retries=3, backoff_factor=1):
+        """Async make_api_request: same 429 and 500/503 handling, without blocking the loop."""
+        for attempt in range(retries):
+            try:
+                await RATE_LIMITER.acquire_async()
+                return await self._send(url, params)
+            except RequestException as e:
+                retry_after = handle_request_error(e, action)
+                if retry_after is not None:  # 429 Rate Limit
+                    RATE_LIMITER.backoff(retry_after + random.uniform(0, 0.1))  # Jitter
+                    continue
+                elif isinstance(e, HTTPError) and e.response.status_code in (500, 503):  # Transient errors
+                    if attempt < retries - 1:
+                        delay = backoff_factor * (2 ** attempt) + random.uniform(0, 0.1)
+                        await asyncio.sleep(delay)
+                        continue
+                raise e
+        raise RequestException(f"Failed to complete {action} after {retries} attempts")
+
+    async def paginate(self, url, params, action, raise_errors=False):
+        """Async paginated_api_fetch: yields items page by page."""
+        params = dict(params)
+        page = 0
+        while True:
+            params["page"] = page
+            try:
+                data = (await self.get(url, params, action)).json()
+            except RequestException:
+                if raise_errors:
+                    raise
+                break
+            items = data.get("data", [])
+            for item in items:
+                yield item
+            if not items or len(items) < params["pagesize"] or data.get("truncatedResults", False):
+                break
+            page += 1
+
+    def close(self):
+        if self._http is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._http.aclose(), self._loop).result(timeout=5)
+        self._http = None
+
+class PackageStore:
+    """SQLite copy of each project's packages plus the watermark of its last sync.
+
+    The watermark is the newest modifiedDT seen from the API, so delta queries
+    do not depend on the local clock.
+    """
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS packages ("
+                              "project_id TEXT, package_id TEXT, position INTEGER, data TEXT, "
+                              "PRIMARY KEY (project_id, package_id))")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS syncs ("
+                              "project_id TEXT PRIMARY KEY, watermark TEXT, full_sync REAL)")
+
+    def load(self, project_id):
+        """Return (packages, watermark, time of last full sync), or None if never synced."""
+        with self.lock:
+            sync = self.conn.execute("SELECT watermark, full_sync FROM syncs WHERE project_id = ?",
+                                     (project_id,)).fetchone()
+            if sync is None:
+                return None
+            rows = self.conn.execute("SELECT data FROM packages WHERE project_id = ? ORDER BY position",
+                                     (project_id,)).fetchall()
+        return [json.loads(data) for (data,) in rows], sync[0], sync[1]
+
+    def replace(self, project_id, packages):
+        """Store a full snapshot of the project's packages."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM packages WHERE project_id = ?", (project_id,))
+            self.conn.executemany("INSERT INTO packages VALUES (?, ?, ?, ?)",
+                                  [(project_id, pkg.get("id"), i, json.dumps(pkg)) for i, pkg in enumerate(packages)])
+            self.conn.execute("INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)",
+                              (project_id, self.watermark(packages), time.time()))
+
+    def update(self, project_id, packages):
+        """Merge changed packages into the stored snapshot and advance the watermark."""
+        with self.lock, self.conn:
+            watermark, full_sync = self.conn.execute("SELECT watermark, full_sync FROM syncs WHERE project_id = ?",
+                                                     (project_id,)).fetchone()
+            next_position = self.conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM packages WHERE project_id = ?",
+                                              (project_id,)).fetchone()[0]
+            for pkg in packages:
+                updated = self.conn.execute("UPDATE packages SET data = ? WHERE project_id = ? AND package_id = ?",
+                                            (json.dumps(pkg), project_id, pkg.get("id"))).rowcount
+                if not updated:
+                    self.conn.execute("INSERT INTO packages VALUES (?, ?, ?, ?)",
+                                      (project_id, pkg.get("id"), next_position, json.dumps(pkg)))
+                    next_position += 1
+            self.conn.execute("UPDATE syncs SET watermark = ? WHERE project_id = ?",
+                              (max(filter(None, (watermark, self.watermark(packages)))), project_id))
+
+    def put(self, project_id, package):
+        """Overwrite one stored package (e.g. after a local edit) without moving the watermark."""
+        data = json.dumps({key: value for key, value in package.items() if key != "assembly_count"})
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE packages SET data = ? WHERE project_id = ? AND package_id = ?",
+                              (data, project_id, package.get("id")))
+
+    @staticmethod
+    def watermark(packages):
+        return max((pkg.get("modifiedDT") or "" for pkg in packages), default="") or None
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries also expire after `ttl` seconds."""
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires, value)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+class ApiJob:
+    """A unit of background work; a newer job on the same channel cancels it."""
+    def __init__(self, channel):
+        self.channel = channel
+        self.cancelled = threading.Event()
+        self.future = None  # Set for asyncio jobs so cancel() also cancels the task
+
+    def cancel(self):
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def safe_filename(name):
+    """Make an API-supplied name usable as a file or folder name."""
+    name = "".join("_" if c in '<>:"/\\|?*' or ord(c) < 32 else c for c in name).strip().rstrip(".")
+    return name or "_"
+
+def unique_filename(name, used):
+    """safe_filename(name), numbered "name (2).ext", ... until it is not in used (lowercased); used is updated."""
+    name = safe_filename(name)
+    stem, ext = os.path.splitext(name)
+    candidate = name
+    count = 1
+    while candidate.lower() in used:
+        count += 1
+        candidate = f"{stem} ({count}){ext}"
+    used.add(candidate.lower())
+    return candidate
+
+class DownloadBatch:
+    """Transfers started together, sharing one cancel flag.
+
+    Batches normally run on the app's shared transfer pool; a batch given its own
+    executor (owns_executor) shuts it down when closed. on_file_done(att_id, path,
+    status, size) and on_done() are called on the Tk thread.
+    """
+    def __init__(self, executor, on_file_done=None, on_done=None, download=None, owns_executor=False):
+        self.cancelled = threading.Event()
+        self.download = download  # download(att_id, file_name, save_dir, progress, cancelled) -> status
+        self.executor = executor
+        self.owns_executor = owns_executor
+        self.pending = set()  # Row ids still queued or downloading
+        self.futures = []
+        self.on_file_done = on_file_done
+        self.on_done = on_done
+
+    def submit(self, row, func, *args):
+        self.pending.add(row)
+        self.futures.append(self.executor.submit(func, *args))
+
+    def cancel(self):
+        self.cancelled.set()
+        for future in self.futures:  # Queued work only; the pool may be shared
+            future.cancel()
+        self.close()
+
+    def close(self):
+        if self.owns_executor:
+            self.executor.shutdown(wait=False)
+
+class PartialDownload:
+    """A download written to <file>.part with a small JSON journal beside it.
+
+    The journal records which attachment the bytes belong to, the server's
+    validator (ETag or Last-Modified), the expected size and any Content-MD5, so
+    an interrupted download can continue with a Range request.
+    """
+    def __init__(self, save_path, att_id):
+        self.save_path = save_path
+        self.part_path = save_path + ".part"
+        self.journal_path = save_path + ".part.json"
+        self.att_id = att_id
+        self.journal = {}
+        try:
+            with open(self.journal_path, "r") as f:
+                journal = json.load(f)
+            if journal.get("att_id") == att_id and os.path.exists(self.part_path):
+                self.journal = journal
+        except (OSError, ValueError):
+            pass
+
+    def offset(self):
+        return os.path.getsize(self.part_path) if self.journal else 0
+
+    def request_headers(self):
+        headers = {"Accept-Encoding": "identity"}  # Byte ranges and sizes must refer to the stored bytes
+        offset = self.offset()
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if self.journal.get("validator"):
+                headers["If-Range"] = self.journal["validator"]  # Server sends the whole file if it changed
+        return headers
+
+    def open(self, response):
+        """Return (file, offset, total) for writing the body of response."""
+        if response.status_code == 206:
+            offset = self.offset()
+            span, _, total = response.headers.get("Content-Range", "").partition(" ")[2].partition("/")
+            if not span.startswith(f"{offset}-"):
+                self.discard()
+                raise RequestException(f"Unexpected Content-Range for {os.path.basename(self.save_path)}")
+            total = int(total) if total.isdigit() else None
+            return open(self.part_path, "ab"), offset, total
+        total = int(response.headers.get("Content-Length", 0)) or None
+        self.journal = {"att_id": self.att_id,
+                        "validator": response.headers.get("ETag") or response.headers.get("Last-Modified"),
+                        "total": total,
+                        "md5": response.headers.get("Content-MD5")}
+        with open(self.journal_path, "w") as f:
+            json.dump(self.journal, f)
+        return open(self.part_path, "wb"), 0, total
+
+    def finish(self):
+        """Check the size and Content-MD5 of the .part file, then move it into place."""
+        size = os.path.getsize(self.part_path)
+        if self.journal.get("total") is not None and size != self.journal["total"]:
+            self.discard()
+            raise ValueError(f"expected {self.journal['total']} bytes, received {size}")
+        if self.journal.get("md5"):
+            digest = hashlib.md5()
+            with open(self.part_path, "rb") as f:
+                for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    digest.update(block)
+            if base64.b64encode(digest.digest()).decode() != self.journal["md5"]:
+                self.discard()
+                raise ValueError("Content-MD5 mismatch")
+        os.replace(self.part_path, self.save_path)
+        os.remove(self.journal_path)
+
+    def discard(self):
+        for path in (self.part_path, self.journal_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.journal = {}
+
+class AttachmentStore:
+    """Downloaded attachments kept once per SHA-256, indexed by attachment id.
+
+    Attachment ids are treated as immutable: a file uploaded again gets a new id,
+    so a stored copy never needs revalidating against the server. The store keeps
+    private copies and hands out copies, so editing a downloaded file cannot change
+    what later downloads receive; a blob whose size or mtime differs from what was
+    recorded when it was stored is dropped. Hashing and copying happen outside the
+    lock, which only guards the index; blobs in use are pinned against eviction.
+    """
+    def __init__(self, path, max_bytes=ATTACHMENT_STORE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.pinned = {}  # sha256 -> number of callers reading or writing the blob
+        os.makedirs(path, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(path, "index.sqlite3"), check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS blobs ("
+                              "sha256 TEXT PRIMARY KEY, size INTEGER, last_used REAL, mtime_ns INTEGER)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS attachments (att_id TEXT PRIMARY KEY, sha256 TEXT)")
+            if "mtime_ns" not in [row[1] for row in self.conn.execute("PRAGMA table_info(blobs)")]:
+                # Index from before mtimes were recorded: its blobs fail the check once and are fetched again
+                self.conn.execute("ALTER TABLE blobs ADD COLUMN mtime_ns INTEGER")
+
+    def blob_path(self, sha256):
+        return os.path.join(self.path, sha256[:2], sha256)
+
+    def checkout(self, att_id, dest):
+        """Place the stored copy of att_id at dest; return its size, or None if it is not stored."""
+        return self.use(att_id, lambda blob: self.place(blob, dest))
+
+    def sha256(self, att_id):
+        """Return the content hash of a stored attachment, or None if it was never downloaded."""
+        with self.lock:
+            row = self.conn.execute("SELECT sha256 FROM attachments WHERE att_id = ?", (att_id,)).fetchone()
+        return row[0] if row else None
+
+    def use(self, att_id, func):
+        """Call func(blob_path) for the stored copy of att_id; return its size, or None if it is not stored."""
+        with self.lock:
+            row = self.conn.execute("SELECT blobs.sha256, blobs.size, blobs.mtime_ns FROM attachments "
+                                    "JOIN blobs USING (sha256) WHERE att_id = ?", (att_id,)).fetchone()
+            if row is None:
+                return None
+            sha256, size, mtime_ns = row
+            blob = self.blob_path(sha256)
+            try:
+                stat = os.stat(blob)
+                if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                    raise FileNotFoundError(blob)
+            except OSError:
+                try:
+                    os.remove(blob)
+                except OSError:
+                    pass
+                with self.conn:  # Missing or modified blob: forget it and download again
+                    self.conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+                    self.conn.execute("DELETE FROM attachments WHERE sha256 = ?", (sha256,))
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), sha256))
+            self.pin(sha256)
+        try:
+            func(blob)
+        finally:
+            with self.lock:
+                self.unpin(sha256)
+        return size
+
+    def add(self, att_id, source):
+        """Record a freshly downloaded file, storing its content unless an identical blob exists."""
+        sha256 = file_sha256(source)
+        size = os.path.getsize(source)
+        blob = self.blob_path(sha256)
+        with self.lock:
+            stored = self.conn.execute("SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)).fetchone() is not None
+            if stored:
+                with self.conn:
+                    self.conn.execute("UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), sha256))
+                    self.conn.execute("INSERT OR REPLACE INTO attachments VALUES (?, ?)", (att_id, sha256))
+                return
+            self.pin(sha256)
+        try:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            self.place(source, blob)
+            with self.lock:
+                mtime_ns = os.stat(blob).st_mtime_ns  # Read under the lock: a concurrent add may replace the blob
+                with self.conn:
+                    self.conn.execute("INSERT OR REPLACE INTO blobs (sha256, size, last_used, mtime_ns) "
+                                      "VALUES (?, ?, ?, ?)", (sha256, size, time.time(), mtime_ns))
+                    self.conn.execute("INSERT OR REPLACE INTO attachments VALUES (?, ?)", (att_id, sha256))
+                self.evict()
+        finally:
+            with self.lock:
+                self.unpin(sha256)
+
+    def pin(self, sha256):
+        self.pinned[sha256] = self.pinned.get(sha256, 0) + 1
+
+    def unpin(self, sha256):
+        self.pinned[sha256] -= 1
+        if not self.pinned[sha256]:
+            del self.pinned[sha256]
+
+    def evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        with self.conn:
+            for sha256, size in self.conn.execute("SELECT sha256, size FROM blobs ORDER BY last_used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                if sha256 in self.pinned:  # Being copied right now; evicted on a later pass
+                    continue
+                try:
+                    os.remove(self.blob_path(sha256))
+                except FileNotFoundError:
+                    pass
+                self.conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+                self.conn.execute("DELETE FROM attachments WHERE sha256 = ?", (sha256,))
+                total -= size
+
+    @staticmethod
+    def place(source, dest):
+        """Copy source to dest through a temporary file; never a hardlink, which would share edits."""
+        tmp_path = f"{dest}.{threading.get_ident()}.tmp"  # Per thread, as two workers may write one blob
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, dest)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class MultipartFileStream:
+    """multipart/form-data body for one file, read from disk as it is sent instead of loaded into memory.
+
+    progress(sent, total) is called as requests reads the body; setting cancelled
+    aborts the upload at the next read.
+    """
+    def __init__(self, path, field="file", progress=None, cancelled=None):
+        self.boundary = uuid.uuid4().hex
+        file_name = os.path.basename(path).replace('"', "%22")
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        head = (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{file_name}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n").encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.file = open(path, "rb")
+        self.length = len(head) + os.path.getsize(path) + len(tail)
+        self.parts = [io.BytesIO(head), self.file, io.BytesIO(tail)]
+        self.sent = 0
+        self.progress = progress
+        self.cancelled = cancelled
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self):
+        return self.length  # Lets requests send a Content-Length instead of chunked encoding
+
+    def read(self, size=-1):
+        if self.cancelled is not None and self.cancelled.is_set():
+            raise OSError("Upload cancelled")
+        if size is None or size < 0:
+            size = self.length
+        data = b""
+        while len(data) < size and self.parts:
+            chunk = self.parts[0].read(size - len(data))
+            if chunk:
+                data += chunk
+            else:
+                self.parts.pop(0)
+        self.sent += len(data)
+        if self.progress and data:
+            self.progress(self.sent, self.length)
+        return data
+
+    def close(self):
+        self.file.close()
+
+class ApiDispatcher:
+    """Runs API work on a thread pool and hands the results back to the Tk thread.
+
+    Jobs are grouped by channel (e.g. "packages", "assemblies"). Submitting a job
+    cancels the in-flight job on the same channel, and results of cancelled jobs
+    are dropped instead of being delivered to the UI. Coroutines for bulk work run
+    on an asyncio event loop kept on a helper thread.
+    """
+    def __init__(self, root, max_workers=WORKER_THREADS, on_busy_change=None):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stratus-api")
+        self.jobs = {}  # channel -> ApiJob, only touched on the Tk thread
+        self.pending = 0
+        self.on_busy_change = on_busy_change
+        self.loop = None
+        self.root.after(UI_POLL_MS, self._poll)
+
+    def submit(self, channel, func, *args, on_success=None, on_error=None):
+        """Run func(*args) on a worker; on_success/on_error are called on the Tk thread."""
+        job = self._register(channel)
+        self.executor.submit(self._run, job, func, args, on_success, on_error)
+        return job
+
+    def submit_async(self, channel, coro_func, *args, on_success=None, on_error=None):
+        """Run coro_func(*args) on the event loop; on_success/on_error are called on the Tk thread."""
+        job = self._register(channel)
+        self._start_async(job, coro_func(*args), on_success, on_error)
+        return job
+
+    def submit_async_each(self, channel, coro_func, items, on_result, on_done=None, max_concurrency=WORKER_THREADS):
+        """Await coro_func(item) for every item with at most max_concurrency in flight.
+
+        on_result(item, result) is called on the Tk thread as each item completes,
+        and on_done() once all of them have finished. Items that fail are logged
+        and skipped.
+        """
+        job = self._register(channel)
+
+        async def fan_out():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run_item(item):
+                async with semaphore:
+                    try:
+                        result = await coro_func(item)
+                    except Exception as e:
+                        logging.error(f"Background job {channel} failed for {item!r}: {e}")
+                        return
+                run_on_ui_thread(self._deliver, job, on_result, item, result)
+
+            await asyncio.gather(*(run_item(item) for item in items))
+
+        self._start_async(job, fan_out(), lambda _: on_done() if on_done else None, None)
+        return job
+
+    def cancel(self, *channels):
+        for channel in channels:
+            job = self.jobs.pop(channel, None)
+            if job is not None:
+                job.cancel()
+
+    def shutdown(self):
+        for job in self.jobs.values():
+            job.cancel()
+        self.jobs.clear()
+        self.executor.shutdown(wait=False)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _register(self, channel):
+        if channel is not None:
+            self.cancel(channel)
+        job = ApiJob(channel)
+        if channel is not None:
+            self.jobs[channel] = job
+        self._set_pending(self.pending + 1)
+        return job
+
+    def _start_async(self, job, coro, on_success, on_error):
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, name="stratus-asyncio", daemon=True).start()
+        job.future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        job.future.add_done_callback(
+            lambda future: run_on_ui_thread(self._finish_async, job, future, on_success, on_error))
+
+    def _finish_async(self, job, future, on_success, on_error):
+        if future.cancelled():
+            self._finish(job, None, None)
+        elif future.exception() is not None:
+            e = future.exception()
+            if on_error is None:
+                logging.error(f"Background job {job.channel} failed: {e}", exc_info=e)
+            self._finish(job, on_error, e)
+        else:
+            self._finish(job, on_success, future.result())
+
+    def _run(self, job, func, args, on_success, on_error):
+        if job.cancelled.is_set():
+            run_on_ui_thread(self._finish, job, None, None)
+            return
+        _job_context.job = job
+        try:
+            result = func(*args)
+        except Exception as e:
+            if on_error is None:
+                logging.error(f"Background job {job.channel} failed: {e}", exc_info=True)
+            run_on_ui_thread(self._finish, job, on_error, e)
+        else:
+            run_on_ui_thread(self._finish, job, on_success, result)
+        finally:
+            _job_context.job = None
+
+    def _deliver(self, job, callback, *args):
+        if not job.cancelled.is_set():
+            callback(*args)
+
+    def _finish(self, job, callback, value):
+        self._set_pending(self.pending - 1)
+        if job.channel is not None and self.jobs.get(job.channel) is job:
+            del self.jobs[job.channel]
+        if callback is not None and not job.cancelled.is_set():
+            callback(value)
+
+    def _set_pending(self, pending):
+        was_busy = self.pending > 0
+        self.pending = pending
+        if self.on_busy_change and was_busy != (pending > 0):
+            self.on_busy_change(pending > 0)
+
+    def _poll(self):
+        while True:
+            try:
+                func, args = _ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception:
+                logging.exception("UI callback failed")
+        self.root.after(UI_POLL_MS, self._poll)
+
+class AssemblyCountCache:
+    """Assembly counts keyed by package id, persisted as JSON and expired after a TTL.
+
+    Only used from the Tk thread.
+    """
+    def __init__(self, path, ttl=ASSEMBLY_COUNT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+            now = time.time()
+            self.entries = {k: v for k, v in entries.items() if now - v["fetched"] < ttl}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable assembly count cache {path}: {e}")
+
+    def get(self, package_id):
+        entry = self.entries.get(package_id)
+        if entry is None or time.time() - entry["fetched"] >= self.ttl:
+            return None
+        return entry["count"]
+
+    def set(self, package_id, count):
+        self.entries[package_id] = {"count": count, "fetched": time.time()}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logging.warning(f"Failed to save assembly count cache: {e}")
+
+class ExportManifest:
+    """Per-file status of a project export, kept as JSON in the export folder so a re-run resumes.
+
+    Built on a worker while the export is prepared, then only used from the Tk thread.
+    Listings that failed are saved too; a re-run lists every folder again.
+    """
+    def __init__(self, path, project_id):
+        self.path = path
+        self.files = {}  # att_id -> {"path", "status", "size"}
+        self.failed_listings = []  # {"folder", "listing", "error"}
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+            if manifest.get("project_id") == project_id:
+                self.files = manifest["files"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable export manifest {path}: {e}")
+        self.project_id = project_id
+
+    def is_done(self, att_id, path):
+        entry = self.files.get(att_id)
+        return (entry is not None and entry["status"] == "Done" and entry["path"] == path
+                and os.path.exists(path) and os.path.getsize(path) == entry["size"])
+
+    def record(self, att_id, path, status, size=0):
+        self.files[att_id] = {"path": path, "status": status, "size": size}
+
+    def save(self, summary=None):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"project_id": self.project_id, "summary": summary,
+                           "failed_listings": self.failed_listings, "files": self.files}, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Failed to save export manifest: {e}")
+
+class SearchIndex:
+    """Word index over the name, number, description and category of one source list.
+
+    Plain query terms match any field; field-qualified ones such as number:1200 or
+    desc:"pipe hanger" match one, and every term must match. Terms are looked up in
+    each field's vocabulary through an n-gram index of its words rather than by
+    scanning the entries; a term with no substring hit falls back to words a typo
+    or two away. Every term after the first is only checked against the entries
+    still matching, and a query that extends the previous one as the user types
+    is only checked against its results. Result sets up to SEARCH_RANK_LIMIT are
+    ranked by field and match quality.
+    Built off the Tk thread when data loads; reindex() refreshes an entry edited in place.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.texts = {field: [""] * len(source) for field in SEARCH_FIELDS}
+        self.joined = [""] * len(source)  # All fields on separate lines, for scanning every field at once
+        self.previous = None  # (terms, matched) of the last search without near misses
+        self.words = {field: {} for field in SEARCH_FIELDS}  # field -> word -> {position}
+        self.word_grams = {field: {} for field in SEARCH_FIELDS}  # field -> 1- to 3-gram, " a"/"z " edge -> {word}
+        for position, item in enumerate(source):
+            self._index(position, item)
+
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def edge_bigrams(word):
+        """Bigrams of word padded with a space each side, e.g. " h", "ha", ..., "r " for hanger."""
+        padded = f" {word} "
+        return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+    @staticmethod
+    def edit_distance(a, b, limit):
+        """Edits (insert, delete, replace, swap neighbours) turning a into b, or limit + 1 once above limit."""
+        if abs(len(a) - len(b)) > limit:
+            return limit + 1
+        before, previous = None, list(range(len(b) + 1))
+        for i, x in enumerate(a, 1):
+            row = [i] + [0] * len(b)
+            for j, y in enumerate(b, 1):
+                row[j] = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + (x != y))
+                if i > 1 and j > 1 and x == b[j - 2] and a[i - 2] == y and x != y:
+                    row[j] = min(row[j], before[j - 2] + 1)
+            if min(row) > limit:
+                return limit + 1
+            before, previous = previous, row
+        return min(previous[-1], limit + 1)
+
+    def _index(self, position, item):
+        texts = []
+        for field, words in self.words.items():
+            text = str(item.get(field) or "").lower()
+            self.texts[field][position] = text
+            texts.append(text)
+            for word in text.split():
+                positions = words.get(word)
+                if positions is None:
+                    positions = words[word] = set()
+                    grams = self.word_grams[field]
+                    for size in (1, 2, 3):  # Shorter grams let one- and two-letter terms use the index too
+                        for i in range(len(word) - size + 1):
+                            grams.setdefault(word[i:i + size], set()).add(word)
+                    for gram in (f" {word[0]}", f"{word[-1]} "):  # With the bigrams, lets near() match typos
+                        grams.setdefault(gram, set()).add(word)
+                positions.add(position)
+        self.joined[position] = "\n".join(texts)
+
+    def reindex(self, item):
+        position = next((i for i, entry in enumerate(self.source) if entry is item), None)
+        if position is None:
+            return
+        self.previous = None
+        for field, words in self.words.items():
+            for word in self.texts[field][position].split():
+                words[word].discard(position)
+        self._index(position, item)
+
+    @staticmethod
+    def parse(query):
+        """Split query into [(fields, term), ...]; double quotes group words into one term."""
+        lexer = shlex.shlex(query + '"' * (query.count('"') % 2), posix=True)  # Close a quote still being typed
+        lexer.whitespace_split = True
+        lexer.quotes = '"'
+        lexer.escape = lexer.commenters = ""
+        terms = []
+        for token in lexer:
+            name, sep, value = token.partition(":")
+            if sep and name in SEARCH_FIELD_ALIASES:
+                if value.strip():
+                    terms.append(((SEARCH_FIELD_ALIASES[name],), value.strip()))
+            elif token.strip():  # A lone quote yields an empty token, which would match nothing
+                terms.append((tuple(SEARCH_FIELDS), token.strip()))
+        return terms
+
+    def candidates(self, field, term):
+        """Words of field containing term, or None when scanning the entries is cheaper."""
+        postings = sorted((self.word_grams[field].get(gram, ()) for gram in self.trigrams(term) or {term}), key=len)
+        if len(postings[0]) > len(self.source) // 4:  # Mostly unique words, e.g. numbers
+            return None
+        return [word for word in set(postings[0]).intersection(*postings[1:]) if term in word]
+
+    def containing(self, field, term, within=None):
+        """Positions, out of within if given, whose field has a word containing term."""
+        return self.positions(field, term, self.candidates(field, term), within)
+
+    def positions(self, field, term, found, within=None):
+        """containing() for the words candidates() found."""
+        if found is None:
+            return self.scan(self.texts[field], term, within)
+        positions = set().union(*map(self.words[field].get, found))
+        return positions if within is None else positions & within
+
+    @staticmethod
+    def scan(texts, term, within=None):
+        if within is not None:
+            return {i for i in within if term in texts[i]}
+        return {i for i, text in enumerate(texts) if term in text}
+
+    def near(self, field, term):
+        """[(similarity, {position}), ...] for words of field one typo from term, or two for long terms."""
+        limit = 1 if len(term) < SEARCH_FUZZY_LONG else 2
+        grams = self.edge_bigrams(term)
+        shared = len(grams) - 3 * limit  # One typo changes at most three of the padded bigrams
+        counts = {}
+        for gram in grams:
+            for word in self.word_grams[field].get(gram, ()):
+                counts[word] = counts.get(word, 0) + 1
+        near = []
+        for word, count in counts.items():
+            if count >= shared:
+                distance = self.edit_distance(term, word, limit)
+                if distance <= limit:
+                    near.append((1 - distance / len(term), self.words[field][word]))
+        return near
+
+    def match(self, fields, term, within=None):
+        """Return ({position} of substring hits, {position: score} of near misses) for one term.
+
+        within narrows the substring hits to those positions; near misses are only
+        looked for when the term has no substring hit at all.
+        """
+        parts = term.split()
+        found = {field: self.candidates(field, term) for field in fields} if len(parts) == 1 else {}
+        if len(fields) == len(SEARCH_FIELDS) and found and (
+                None in found.values() or sum(sum(map(len, map(self.words[field].get, words)))
+                                              for field, words in found.items())
+                > 2 * len(within if within is not None else self.source)):
+            # One pass over all fields beats scanning one of them or merging postings twice the size of
+            # what is searched; a term never spans their line breaks
+            exact = self.scan(self.joined, term, within)
+        else:
+            exact = set()
+            for field in fields:
+                if len(parts) > 1:  # Quoted phrase: entries with all its words, then the phrase itself
+                    hits = within
+                    for part in parts:
+                        hits = self.containing(field, part, hits)
+                    texts = self.texts[field]
+                    exact.update(i for i in hits if term in texts[i])
+                else:
+                    exact |= self.positions(field, term, found[field], within)
+                if len(exact) == len(self.source):
+                    break  # Matches everything already
+        if not exact and within is not None:
+            return self.match(fields, term)  # Near misses depend on hits outside within too
+        fuzzy = {}
+        if not exact and len(parts) == 1 and len(term) >= SEARCH_FUZZY_MIN_LENGTH:
+            # Below a substring hit in the same field; ascending so the best score per entry is written last
+            near = sorted(((SEARCH_FIELDS[field] * 0.6 * similarity, positions)
+                           for field in fields for similarity, positions in self.near(field, term)),
+                          key=lambda pair: pair[0])
+            for score, positions in near:
+                fuzzy.update(dict.fromkeys(positions, score))
+        return exact, fuzzy
+
+    def scores(self, positions, fields, term, fuzzy):
+        """{position: best field weight times match quality of term}, near misses scored as in fuzzy."""
+        best = dict.fromkeys(positions, 0)
+        best.update((i, score) for i, score in fuzzy.items() if i in best)
+        word = f" {term}"
+        for field in fields:
+            weight = SEARCH_FIELDS[field]
+            texts = self.texts[field]
+            for i in positions:
+                text = texts[i]
+                if term not in text:
+                    continue
+                if text == term:
+                    score = weight
+                elif text.startswith(term):
+                    score = weight * 0.9
+                elif word in text:
+                    score = weight * 0.8
+                else:
+                    score = weight * 0.7
+                if score > best[i]:
+                    best[i] = score
+        return best
+
+    def find(self, terms, within=None, settled=()):
+        """Return ({position} matching every term, [(fields, term, fuzzy), ...]) for scoring.
+
+        Every position in within already matches the terms at the indexes in settled.
+        """
+        matched, scored = within, []
+        for index, (fields, term) in enumerate(terms):
+            if index in settled:
+                scored.append((fields, term, {}))
+                continue
+            exact, fuzzy = self.match(fields, term, matched)
+            hits = exact.union(fuzzy) if fuzzy else exact
+            matched = hits if matched is None else matched & hits
+            scored.append((fields, term, fuzzy))
+            if not matched:
+                break
+        return matched, scored
+
+    def search(self, query):
+        """Return the entries of source matching query, best first."""
+        terms = self.parse(query)
+        if not terms:
+            return self.source
+        previous, self.previous = self.previous, None
+        if previous is not None and len(terms) >= len(previous[0]) and all(
+                fields == old_fields and old_term in term
+                for (old_fields, old_term), (fields, term) in zip(previous[0], terms)):
+            # Each term contains the old one, so its substring hits are among the previous results
+            settled = {index for index, old in enumerate(previous[0]) if old == terms[index]}
+            matched, scored = self.find(terms, previous[1], settled)
+            if any(fuzzy for _, _, fuzzy in scored):  # Near misses can lie outside them
+                matched, scored = self.find(terms)
+        else:
+            matched, scored = self.find(terms)
+        if not any(fuzzy for _, _, fuzzy in scored):
+            self.previous = terms, matched
+        if not matched:
+            return []
+        if len(matched) > SEARCH_RANK_LIMIT:
+            return self.source if len(matched) == len(self.source) else list(map(self.source.__getitem__, sorted(matched)))
+
+        totals = dict.fromkeys(matched, 0)
+        for fields, term, fuzzy in scored:
+            for i, score in self.scores(matched, fields, term, fuzzy).items():
+                totals[i] -= score
+        return [self.source[i] for i in sorted(matched, key=lambda i: (totals[i], i))]
+
+class VirtualTable:
+    """Treeview front-end that keeps every row in a list and only creates items for the visible window.
+
+    Scrolling rewrites the values of the screenful of items Tk holds, so loading
+    or scrolling tens of thousands of rows costs the same as one screen. Anything
+    not defined here is forwarded to the Treeview. Only used from the Tk thread.
+    """
+    def __init__(self, tree, scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = []  # [(id, values), ...]
+        self.offset = 0
+        self.visible = int(tree.cget("height"))
+        self.selected_key = None
+        tree.configure(yscrollcommand="")
+        tree.bind("<Configure>", lambda e: self.fit(), add="+")
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, self._on_wheel)
+        tree.bind("<Up>", lambda e: self.move_selection(-1))
+        tree.bind("<Down>", lambda e: self.move_selection(1))
+        tree.bind("<Prior>", lambda e: self.move_selection(-self.visible))
+        tree.bind("<Next>", lambda e: self.move_selection(self.visible))
+
+    def __getattr__(self, name):
+        return getattr(self.tree, name)
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+        self.offset = max(0, min(self.offset, len(self.rows) - self.visible))
+        self.render()
+
+    def yview(self, *args):
+        if not args:
+            total = len(self.rows) or 1
+            return self.offset / total, min(1.0, (self.offset + self.visible) / total)
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            self.scroll_to(self.offset + int(args[1]) * (self.visible if args[2] == "pages" else 1))
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, len(self.rows) - self.visible))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def select(self, key):
+        """Select the row with this id, scrolling it into view; return False if there is none."""
+        key = str(key)
+        for index, (row_key, _) in enumerate(self.rows):
+            if str(row_key) == key:
+                self.selected_key = key
+                if not self.offset <= index < self.offset + self.visible:
+                    self.offset = max(0, min(index - self.visible // 2, len(self.rows) - self.visible))
+                self.render()
+                return True
+        return False
+
+    def move_selection(self, step):
+        keys = [str(key) for key, _ in self.rows]
+        if not keys:
+            return "break"
+        index = keys.index(self.selected_key) + step if self.selected_key in keys else self.offset
+        index = max(0, min(index, len(keys) - 1))
+        self.selected_key = keys[index]
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible:
+            self.offset = index - self.visible + 1
+        self.render()
+        return "break"
+
+    def render(self):
+        items = self.tree.get_children()
+        window = self.rows[self.offset:self.offset + self.visible]
+        for i, (key, values) in enumerate(window):
+            if i < len(items):
+                self.tree.item(items[i], values=values, tags=(str(key),))
+            else:
+                self.tree.insert("", "end", values=values, tags=(str(key),))
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+        items = self.tree.get_children()
+        self.tree.selection_set([item for item, (key, _) in zip(items, window) if str(key) == self.selected_key])
+        self.scrollbar.set(*self.yview())
+        self.fit()
+
+    def fit(self):
+        """Match the number of rendered rows to the widget's current height."""
+        items = self.tree.get_children()
+        bbox = self.tree.bbox(items[0]) if items else ""
+        if not bbox:
+            return
+        visible = max(1, (self.tree.winfo_height() - bbox[1]) // bbox[3])
+        if visible != self.visible:
+            self.visible = visible
+            self.offset = max(0, min(self.offset, len(self.rows) - self.visible))
+            self.render()
+
+    def _on_select(self, event):
+        selected = self.tree.selection()
+        if selected:  # Empty when the selected row scrolls out of the window
+            self.selected_key = str(self.tree.item(selected[0], "tags")[0])
+
+    def _on_wheel(self, event):
+        step = -1 if event.num == 4 or getattr(event, "delta", 0) > 0 else 1
+        self.scroll_to(self.offset + 3 * step)
+        return "break"
+
+class UploadQueue:
+    """Pending uploads persisted as JSON so they survive a restart.
+
+    Only used from the Tk thread.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # entry id -> {"endpoint", "path", "cache_key"}
+        try:
+            with open(path, "r") as f:
+                self.entries = {entry_id: dict(entry, cache_key=tuple(entry["cache_key"]))
+                                for entry_id, entry in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable upload queue {path}: {e}")
+
+    def add(self, endpoint, path, cache_key):
+        entry_id = uuid.uuid4().hex
+        self.entries[entry_id] = {"endpoint": endpoint, "path": path, "cache_key": cache_key}
+        return entry_id
+
+    def remove(self, entry_id):
+        if self.entries.pop(entry_id, None) is not None:
+            self.save()
+
+    def clear(self):
+        self.entries = {}
+        self.save()
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Failed to save upload queue: {e}")
+
+class UploadManifest:
+    """Size, mtime and SHA-256 of the files last uploaded to each package/assembly, by file name.
+
+    Persisted as JSON; only modified on the Tk thread.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.targets = {}  # "package:<id>" / "assembly:<id>" -> {file_name: {"size", "mtime", "sha256"}}
+        try:
+            with open(path, "r") as f:
+                self.targets = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable upload manifest {path}: {e}")
+
+    @staticmethod
+    def target(cache_key):
+        return ":".join(cache_key)
+
+    def files(self, cache_key):
+        return dict(self.targets.get(self.target(cache_key), {}))
+
+    def record(self, cache_key, file_name, size, mtime, sha256):
+        self.targets.setdefault(self.target(cache_key), {})[file_name] = {"size": size, "mtime": mtime, "sha256": sha256}
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self.targets, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Failed to save upload manifest: {e}")
+
 class StratusGUI:
     def __init__(self, root):
         self.root = root
         self.setup_variables()
+        self.dispatcher = ApiDispatcher(root, on_busy_change=self.on_busy_change)
         self.setup_main_frame()
         self.setup_left_frame()
         self.setup_notebook()
+        self.setup_status_bar()
         self.fetch_projects()
+        self.start_uploads(list(self.upload_queue.entries))
 
     def setup_variables(self):
         self.app_key = get_api_key(self.root)
-        self.headers = {"app-key": self.app_key, "Accept": "application/json"}
+        self.client = StratusClient(self.app_key,
+                                    cache=ResponseCache(os.path.join(APP_DIR, RESPONSE_CACHE_FILE)))
+        self.async_client = AsyncStratusClient(self.client)
+        self.package_store = PackageStore(os.path.join(APP_DIR, PACKAGE_STORE_FILE))
+        self.attachment_store = AttachmentStore(os.path.join(APP_DIR, ATTACHMENT_STORE_DIR))
         self.projects = []
         self.all_projects = []
         self.packages = []
@@ -171,9 +1747,30 @@ class StratusGUI:
         self.tracking_statuses = []
         self.selected_package_id = None
         self.selected_assembly_id = None
+        self.assembly_count_cache = AssemblyCountCache(os.path.join(APP_DIR, ASSEMBLY_COUNT_CACHE_FILE))
+        self.assembly_count_jobs = []
+        self.assembly_counts_requested = set()
+        self._count_after_id = None
+        self.search_indexes = {}  # "projects"|"packages"|"assemblies" -> SearchIndex over the matching all_* list
+        self._filter_after_ids = {}
         self.package_data = {}
+        self.attachment_cache = TTLCache(ATTACHMENT_CACHE_SIZE, ATTACHMENT_CACHE_TTL)  # ("package"|"assembly", id) -> listing
         self.property_fields = {}
         self.initial_field_values = {}
+        self.notifications = NotificationLog()
+        self.notifications_window = None
+        self.download_workers = IntVar(value=DOWNLOAD_WORKERS)
+        self.download_as_zip = BooleanVar(value=False)
+        self.download_batches = []
+        self.transfer_pool = None  # Shared by every download and upload batch, sized by download_workers
+        self.transfer_pool_size = 0
+        self.download_rows = {}  # downloads_table row -> {"name", "done", "total", "status"}
+        self.downloads_window = None
+        self.upload_queue = UploadQueue(os.path.join(APP_DIR, UPLOAD_QUEUE_FILE))
+        self.uploaded_cache_keys = set()  # Listings to refresh once the upload queue drains
+        self.uploaded_count = 0
+        self.upload_manifest = UploadManifest(os.path.join(APP_DIR, UPLOAD_MANIFEST_FILE))
+        self.upload_skip_unchanged = BooleanVar(value=False)
 
     def setup_main_frame(self):
         self.main_frame = tb.Frame(self.root, padding="10")
@@ -213,10 +1810,23 @@ class StratusGUI:
         self.refresh_button = tb.Button(self.left_frame, text="Refresh", command=self.refresh_tables,
                                        width=10, bootstyle="primary")
         self.refresh_button.grid(row=8, column=0, padx=5, pady=5, sticky="w")
-        self.close_button = tb.Button(self.left_frame, text="Close", command=self.root.quit,
+        self.close_button = tb.Button(self.left_frame, text="Close", command=self.close_app,
                                       width=10, bootstyle="primary")
         self.close_button.grid(row=9, column=0, padx=5, pady=5, sticky="w")
 
+        # Client-side rate limiter state
+        self.rate_status_label = tb.Label(self.left_frame, text="", font=("Arial", 9))
+        self.rate_status_label.grid(row=10, column=0, padx=5, pady=5, sticky="w")
+        self.update_rate_status()
+
+        self.export_button = tb.Button(self.left_frame, text="Export Project", command=self.export_project,
+                                       width=14, bootstyle="primary")
+        self.export_button.grid(row=11, column=0, padx=5, pady=5, sticky="w")
+        tb.Checkbutton(self.left_frame, text="Download as ZIP", variable=self.download_as_zip,
+                       bootstyle="primary").grid(row=12, column=0, padx=5, pady=5, sticky="w")
+        tb.Checkbutton(self.left_frame, text="Upload only new/changed files", variable=self.upload_skip_unchanged,
+                       bootstyle="primary").grid(row=13, column=0, padx=5, pady=5, sticky="w")
+
         # Load app logo
         self.app_photo = None
         try:
@@ -231,8 +1841,8 @@ class StratusGUI:
             self.app_logo = tb.Label(self.left_frame, image=self.app_photo)
         else:
             self.app_logo = tb.Label(self.left_frame, text="Logo Unavailable", font=("Arial", 16, "bold"), foreground="red")
-        self.app_logo.grid(row=13, column=0, columnspan=2, padx=10, pady=10, sticky="sw")
-        self.left_frame.rowconfigure(14, weight=1)
+        self.app_logo.grid(row=14, column=0, columnspan=2, padx=10, pady=10, sticky="sw")
+        self.left_frame.rowconfigure(15, weight=1)
 
     def setup_notebook(self):
         # Notebook for tabs
@@ -253,8 +1863,10 @@ class StratusGUI:
             columns=("name", "assembly_count", "description"),
             column_widths=[350, 250, 400],
             heading_map={"name": "Name", "assembly_count": "Assembly Count", "description": "Description"},
-            height=18  # <-- Set your desired number of rows here
+            height=18,  # <-- Set your desired number of rows here
+            on_scroll=self.schedule_visible_assembly_counts
         )
+        self.package_table.bind("<Configure>", self.schedule_visible_assembly_counts, add="+")
 
         self.package_table.bind("<<TreeviewSelect>>", self.on_package_select)
         self.package_frame.columnconfigure(0, weight=1)
@@ -307,12 +1919,16 @@ class StratusGUI:
         self.package_upload_entry = tb.Entry(self.package_attachment_controls_frame, textvariable=self.package_upload_var,
                                              width=30, state="readonly")
         self.package_upload_entry.grid(row=0, column=2, sticky="ew", padx=(0, 5))
-        self.package_browse_button = tb.Button(self.package_attachment_controls_frame, text="Browse File",
+        self.package_browse_button = tb.Button(self.package_attachment_controls_frame, text="Browse Files",
                                                command=self.browse_package_file, bootstyle="primary")
         self.package_browse_button.grid(row=0, column=3, sticky="ew", padx=(0, 5))
-        self.package_upload_button = tb.Button(self.package_attachment_controls_frame, text="Upload File",
+        self.package_upload_button = tb.Button(self.package_attachment_controls_frame, text="Upload Files",
                                                command=self.upload_package_attachment, bootstyle="primary")
         self.package_upload_button.grid(row=0, column=4, sticky="ew", padx=(0, 5))
+        self.package_upload_folder_button = tb.Button(self.package_attachment_controls_frame, text="Upload Folder",
+                                                      command=self.upload_package_folder, bootstyle="primary")
+        self.package_upload_folder_button.grid(row=0, column=5, sticky="ew", padx=(0, 5))
+        self.register_drop_target(self.package_attachment_table, self.drop_package_files)
 
         # Assemblies table
         self.assembly_frame = tb.Frame(self.attachments_frame)
@@ -371,12 +1987,16 @@ class StratusGUI:
         self.assembly_upload_entry = tb.Entry(self.assembly_attachment_controls_frame, textvariable=self.assembly_upload_var,
                                               width=30, state="readonly")
         self.assembly_upload_entry.grid(row=0, column=2, sticky="ew", padx=(0, 5))
-        self.assembly_browse_button = tb.Button(self.assembly_attachment_controls_frame, text="Browse File",
+        self.assembly_browse_button = tb.Button(self.assembly_attachment_controls_frame, text="Browse Files",
                                                 command=self.browse_assembly_file, bootstyle="primary")
         self.assembly_browse_button.grid(row=0, column=3, sticky="ew", padx=(0, 5))
-        self.assembly_upload_button = tb.Button(self.assembly_attachment_controls_frame, text="Upload File",
+        self.assembly_upload_button = tb.Button(self.assembly_attachment_controls_frame, text="Upload Files",
                                                 command=self.upload_assembly_attachment, bootstyle="primary")
         self.assembly_upload_button.grid(row=0, column=4, sticky="ew", padx=(0, 5))
+        self.assembly_upload_folder_button = tb.Button(self.assembly_attachment_controls_frame, text="Upload Folder",
+                                                       command=self.upload_assembly_folder, bootstyle="primary")
+        self.assembly_upload_folder_button.grid(row=0, column=5, sticky="ew", padx=(0, 5))
+        self.register_drop_target(self.assembly_attachment_table, self.drop_assembly_files)
 
         # Package Properties tab
         self.properties_frame = tb.Frame(self.notebook)
@@ -434,18 +2054,18 @@ class StratusGUI:
             self.activity_frame,
             columns=activity_columns,
             column_widths=column_widths,
-            stretch_columns=["stationName"]  # Only the last column stretches
+            stretch_columns=["stationName"],  # Only the last column stretches
+            virtual=True
         )
         
         # Users tab
         self.users_frame = tb.Frame(self.notebook)
         self.notebook.add(self.users_frame, text="Users")
-        params = {"include": "id,firstName,lastName,email,status", "pagesize": PAGE_SIZE, "disabletotal": True}
-        response = make_api_request(f"{BASE_URL}{ENDPOINTS['user']}", self.headers, params, "Fetch users")
         self.users_table = self.create_table_with_scrollbars(
             self.users_frame,
             columns=("firstName", "lastName", "email", "status"),
-            column_widths=[150, 150, 200, 100]
+            column_widths=[150, 150, 200, 100],
+            virtual=True
         )
 
         # Containers tab
@@ -454,7 +2074,8 @@ class StratusGUI:
         self.containers_table = self.create_table_with_scrollbars(
             self.containers_frame,
             columns=("name", "description"),
-            column_widths=[150, 300]
+            column_widths=[150, 300],
+            virtual=True
         )
         
         # Tracking Statuses tab
@@ -483,7 +2104,22 @@ class StratusGUI:
             "health": False,
             "tracking_statuses": False
         }
+        self.stale_tabs = set()  # Tabs to revalidate when next opened, set by refresh_tables
         
+    def setup_status_bar(self):
+        # Errors and warnings from workers land here instead of in modal dialogs
+        self.status_bar = tb.Frame(self.main_frame)
+        self.status_bar.grid(row=1, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 0))
+        self.status_bar.columnconfigure(0, weight=1)
+        self.status_message = tb.Label(self.status_bar, text="Ready", anchor="w", foreground="gray")
+        self.status_message.grid(row=0, column=0, sticky="ew")
+        self.notifications_button = tb.Button(self.status_bar, text="Notifications (0)",
+                                              command=self.show_notifications, bootstyle="secondary")
+        self.notifications_button.grid(row=0, column=1, sticky="e")
+        tb.Button(self.status_bar, text="Transfers", command=self.show_downloads,
+                  bootstyle="secondary").grid(row=0, column=2, sticky="e", padx=(5, 0))
+        self.poll_notifications()
+
 #------------------------------------------------------------------------------------------------------------------------------------
 #------------------------------------------------------------------------------------------------------------------------------------
 #------------------------------------------------------------------------------------------------------------------------------------
@@ -494,7 +2130,9 @@ class StratusGUI:
 #------------------------------------------------------------------------------------------------------------------------------------
 #------------------------------------------------------------------------------------------------------------------------------------
 
-    def create_table_with_scrollbars(self, parent, columns, column_widths, heading_map=None, height=12, stretch_columns=None):
+    def create_table_with_scrollbars(self, parent, columns, column_widths, heading_map=None, height=12, stretch_columns=None,
+                                     on_scroll=None, virtual=False):
+        """Create a Treeview with scrollbars; with virtual, return a VirtualTable for very long read-only lists."""
         table = tb.Treeview(parent, columns=columns, show="headings", bootstyle="dark", height=height)
         if stretch_columns is None:
             stretch_columns = []
@@ -504,11 +2142,19 @@ class StratusGUI:
             table.heading(col, text=heading)
             table.column(col, width=column_widths[i] if i < len(column_widths) else 100, anchor="w", stretch=stretch)
         table.grid(row=0, column=0, sticky="nsew")
+        table._id_index = {}  # entity id -> item, maintained by merge_table_rows and clear_table
+        table._detached = set()  # Indexed items hidden by filter_table_rows
 
         # Vertical scrollbar
         v_scrollbar = tb.Scrollbar(parent, orient="vertical", command=table.yview, bootstyle="dark")
         v_scrollbar.grid(row=0, column=1, sticky="ns")
-        table.configure(yscrollcommand=v_scrollbar.set)
+        if on_scroll:
+            def yscroll(first, last):
+                v_scrollbar.set(first, last)
+                on_scroll()
+            table.configure(yscrollcommand=yscroll)
+        else:
+            table.configure(yscrollcommand=v_scrollbar.set)
 
         # Horizontal scrollbar
         h_scrollbar = tb.Scrollbar(parent, orient="horizontal", command=table.xview, bootstyle="dark")
@@ -522,6 +2168,9 @@ class StratusGUI:
         table.bind('<Button-1>', lambda e, t=table: self._treeview_separator_click(e, t), add="+")
         table.bind('<Double-Button-1>', lambda e, t=table: self._treeview_separator_double_click(e, t), add="+")
 
+        if virtual:
+            table = VirtualTable(table, v_scrollbar)
+            v_scrollbar.configure(command=table.yview)
         return table
 
     def _treeview_separator_click(self, event, tree):
@@ -560,12 +2209,135 @@ class StratusGUI:
         tree.column(col_id, width=max_width)
 
     def clear_table(self, table: tb.Treeview) -> None:
-        for item in table.get_children():
-            table.delete(item)
+        self.cancel_table_merge(table)
+        if isinstance(table, VirtualTable):
+            table.set_rows([])
+            return
+        items = (*table.get_children(), *table._detached)
+        if items:
+            table.delete(*items)  # One Tcl call instead of one per row
+        table._id_index = {}
+        table._detached = set()
+
+    def cancel_table_merge(self, table):
+        """Stop a batched merge_table_rows still filling table."""
+        after_id = getattr(table, "_merge_after", None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+            table._merge_after = None
+
+    def merge_table_rows(self, table, rows, on_done=None):
+        """Make table show rows [(id, values), ...] in order, reusing existing rows with the same id.
+
+        Rows are updated in place rather than cleared and rebuilt, so the selection
+        and scroll position survive a reload. The first TABLE_FIRST_BATCH rows are
+        merged at once and the rest in TABLE_BATCH_MS slices on later after() ticks;
+        a newer merge or clear of the same table stops the old one. Returns {id: item},
+        which keeps filling as batches land; on_done() runs once the table is complete.
+        A VirtualTable just swaps in the new list and returns {}.
+        """
+        self.cancel_table_merge(table)
+        if isinstance(table, VirtualTable):
+            table.set_rows(rows)
+            if on_done:
+                on_done()
+            return {}
+        rows = list(rows)
+        children = table.get_children()
+        detached = table._detached
+        if len(children) + len(detached) == len(table._id_index):
+            existing = {key: [item] for key, item in table._id_index.items()}
+        else:  # Rows added outside merge_table_rows (or duplicate ids): rebuild from the tags
+            existing = {}
+            for item in (*children, *detached):
+                tags = table.item(item, "tags")
+                existing.setdefault(str(tags[0]) if tags else "", []).append(item)
+        # Reused items keep their entries, so lookups work while later batches are pending
+        index = table._id_index = {key: items[0] for key, items in existing.items()}
+        state = {"position": 0}
+
+        def merge_batch(limit, deadline=None):
+            position = state["position"]
+            while position < limit:
+                key, values = rows[position]
+                key = str(key)
+                matches = existing.get(key)
+                if matches:
+                    item = matches.pop(0)
+                    table.item(item, values=values)
+                    if item in detached:
+                        detached.discard(item)
+                        table.move(item, "", position)
+                    elif table.index(item) != position:
+                        table.move(item, "", position)
+                else:
+                    item = table.insert("", position, values=values, tags=(key,))
+                index[key] = item
+                position += 1
+                if deadline is not None and position % 50 == 0 and time.perf_counter() > deadline:
+                    break
+            state["position"] = position
+            if position < len(rows):
+                table._merge_after = self.root.after(1, next_batch)
+                return
+            table._merge_after = None
+            stale = [item for items in existing.values() for item in items]
+            if stale:
+                table.delete(*stale)
+                stale = set(stale)
+                detached.difference_update(stale)
+                for key in [key for key, item in index.items() if item in stale]:
+                    del index[key]
+            if on_done:
+                on_done()
+
+        def next_batch():
+            table._merge_after = None
+            merge_batch(len(rows), time.perf_counter() + TABLE_BATCH_MS / 1000)
+
+        merge_batch(min(len(rows), TABLE_FIRST_BATCH))
+        return index
+
+    def filter_table_rows(self, table, rows):
+        """Show only rows [(id, values), ...] by detaching and reattaching items instead of rebuilding.
+
+        Only items whose visibility changes are touched, and ids the table has never
+        held are inserted; values of existing items are left alone. Rows that would
+        change the order of rows already shown (ranked search results), a VirtualTable,
+        a merge still in progress or an index out of step with the table fall back
+        to merge_table_rows.
+        """
+        if isinstance(table, VirtualTable) or getattr(table, "_merge_after", None) is not None:
+            return self.merge_table_rows(table, rows)
+        index, detached = table._id_index, table._detached
+        children = table.get_children()
+        keys = [str(key) for key, _ in rows]
+        shown = {item: position for position, item in enumerate(children)}
+        order = [shown[index[key]] for key in keys if index.get(key) in shown]
+        if (len(children) + len(detached) != len(index)
+                or any(a > b for a, b in zip(order, order[1:]))):
+            return self.merge_table_rows(table, rows)
+        wanted = set(keys)
+        hide = [item for key, item in index.items() if key not in wanted and item not in detached]
+        if hide:
+            table.detach(*hide)
+            detached.update(hide)
+        for position, (key, (_, values)) in enumerate(zip(keys, rows)):
+            item = index.get(key)
+            if item is None:
+                index[key] = table.insert("", position, values=values, tags=(key,))
+            elif item in detached:
+                detached.discard(item)
+                table.move(item, "", position)
+        return index
 
     def clear_tables_and_fields(self):
         # Clear package table
         self.clear_table(self.package_table)
+        self.clear_package_details()
+
+    def clear_package_details(self):
+        """Clear everything shown for the selected package, leaving the package table alone."""
         # Clear package attachments table
         self.clear_table(self.package_attachment_table)
         self.package_no_attachments_label.place_forget()
@@ -582,13 +2354,10 @@ class StratusGUI:
         self.selected_assembly_id = None
 
     def filter_items(self, item_type: str, filter_text: str = "") -> None:
-        source = (self.all_projects if item_type == "projects" else
-                  self.all_packages if item_type == "packages" else self.all_assemblies)
-        filtered = source if not filter_text else [
-            item for item in source if filter_text in item.get("name", "").lower()
-        ]
-        setattr(self, item_type, filtered)
+        """Apply filter_text to one list; tables are updated by diff and projects are only refetched on a new selection."""
         if item_type == "projects":
+            previous_project_id = self.current_project_id()
+            self.projects = self.filter_source("projects", filter_text)
             current_selection = self.project_var.get()
             project_names = ["Choose Project"] + [p.get("name", "Unnamed") for p in self.projects]
             self.project_dropdown["values"] = project_names
@@ -596,53 +2365,67 @@ class StratusGUI:
                 self.project_dropdown.set(current_selection)
             else:
                 self.project_dropdown.current(0)
-            selected_index = self.project_dropdown.current()
-            if selected_index > 0 and self.projects:
-                project_id = self.projects[selected_index - 1].get("id")
+            project_id = self.current_project_id()
+            if project_id == previous_project_id:
+                return  # Same project still selected: its packages are already loaded
+            if project_id:
                 self.fetch_packages_by_id(project_id)
             else:
                 self.clear_tables_and_fields()
                 self.selected_package_id = None
         elif item_type == "packages":
-            self.update_table("packages")
-            if self.selected_package_id:
-                for item in self.package_table.get_children():
-                    if self.package_table.item(item)["tags"][0] == self.selected_package_id:
-                        self.package_table.selection_set(item)
-                        self.on_package_select(None)
-                        break
-                else:
-                    self.package_table.selection_remove(self.package_table.selection())
-                    self.clear_tables_and_fields()
-                    self.selected_package_id = None
+            self.packages = self.filter_source("packages", filter_text)
+            self.filter_table_rows(self.package_table, self.table_rows("packages"))
+            self.schedule_visible_assembly_counts()
+            if self.selected_package_id and not self.is_row_shown(self.package_table, self.selected_package_id):
+                self.package_table.selection_remove(self.package_table.selection())
+                self.clear_package_details()
         else:  # assemblies
-            self.update_table("assemblies")
-            if self.selected_assembly_id:
-                for item in self.assembly_table.get_children():
-                    if self.assembly_table.item(item)["tags"][0] == self.selected_assembly_id:
-                        self.assembly_table.selection_set(item)
-                        self.fetch_assembly_attachments(None)
-                        break
-                else:
-                    self.assembly_table.selection_remove(self.assembly_table.selection())
-                    self.assembly_attachment_table.delete(*self.assembly_attachment_table.get_children())
-                    self.assembly_no_attachments_label.place_forget()
-                    self.selected_assembly_id = None
-
-    def update_table(self, item_type: str) -> None:
+            self.assemblies = self.filter_source("assemblies", filter_text)
+            self.filter_table_rows(self.assembly_table, self.table_rows("assemblies"))
+            if self.selected_assembly_id and not self.is_row_shown(self.assembly_table, self.selected_assembly_id):
+                self.assembly_table.selection_remove(self.assembly_table.selection())
+                self.clear_table(self.assembly_attachment_table)
+                self.assembly_no_attachments_label.place_forget()
+                self.selected_assembly_id = None
+
+    def filter_source(self, item_type, filter_text):
+        """Return the all_<item_type> entries matching filter_text, via that list's SearchIndex."""
+        source = getattr(self, f"all_{item_type}")
+        index = self.search_indexes.get(item_type)
+        if index is None or index.source is not source:
+            index = self.search_indexes[item_type] = SearchIndex(source)
+        return index.search(filter_text)
+
+    def is_row_shown(self, table, entity_id) -> bool:
+        """True if the row for entity_id is in table and not hidden by a filter."""
+        item = table._id_index.get(str(entity_id))
+        return item is not None and item not in table._detached
+
+    def select_table_row(self, table, entity_id) -> bool:
+        """Select the row tagged with entity_id; return False if it is not in the table."""
+        if isinstance(table, VirtualTable):
+            return table.select(entity_id)
+        item = table._id_index.get(str(entity_id))
+        if item is None or item in table._detached or not table.exists(item):
+            return False
+        table.selection_set(item)
+        return True
+
+    def update_table(self, item_type: str, on_done=None) -> None:
         table = self.package_table if item_type == "packages" else self.assembly_table
         items = self.packages if item_type == "packages" else self.assemblies
         attachment_table = self.package_attachment_table if item_type == "packages" else self.assembly_attachment_table
         no_attachments_label = self.package_no_attachments_label if item_type == "packages" else self.assembly_no_attachments_label
-        self.clear_table(table)
         if item_type == "packages":
-            for item in items:
-                table.insert("", "end", values=(item.get("name", ""), item.get("assembly_count", 0), item.get("description", "")),
-                             tags=(item.get("id", ""),))
+            def packages_done():
+                self.schedule_visible_assembly_counts()  # Counts are only fetched once every row exists
+                if on_done:
+                    on_done()
+
+            self.merge_table_rows(table, self.table_rows("packages"), on_done=packages_done)
         else:
-            for item in items:
-                table.insert("", "end", values=(item.get("name", ""), item.get("description", "")),
-                             tags=(item.get("id", ""),))
+            self.merge_table_rows(table, self.table_rows("assemblies"), on_done=on_done)
         if not items:
             self.clear_table(attachment_table)
             no_attachments_label.place_forget()
@@ -651,6 +2434,14 @@ class StratusGUI:
                     var.set("")
                 self.unsaved_alert.grid_remove()
 
+    def table_rows(self, item_type):
+        """(id, values) rows for the filtered packages or assemblies."""
+        if item_type == "packages":
+            return [(item.get("id", ""), (item.get("name", ""), item.get("assembly_count", ""),
+                                          item.get("description", "")))
+                    for item in self.packages]
+        return [(item.get("id", ""), (item.get("name", ""), item.get("description", ""))) for item in self.assemblies]
+
     def _clear_placeholder(self, event, placeholder):
         entry = event.widget
         if entry.get() == placeholder:
@@ -663,14 +2454,25 @@ class StratusGUI:
             entry.insert(0, placeholder)
             entry.configure(foreground="gray", font=("Arial", 10, ""))
 
-    def _on_filter_keyrelease(self, event, item_type):
-        entry = event.widget
+    def get_filter_text(self, item_type):
+        entry = {"projects": self.project_filter, "packages": self.package_filter,
+                 "assemblies": self.assembly_filter}[item_type]
         filter_text = entry.get().strip().lower()
         placeholder = {"projects": "Filter Projects", "packages": "Filter Packages",
                        "assemblies": "Filter Assemblies"}[item_type]
         if filter_text == placeholder.lower():
             filter_text = ""
-        self.filter_items(item_type, filter_text)
+        return filter_text
+
+    def _on_filter_keyrelease(self, event, item_type):
+        after_id = self._filter_after_ids.pop(item_type, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._filter_after_ids[item_type] = self.root.after(FILTER_DEBOUNCE_MS, self._apply_filter, item_type)
+
+    def _apply_filter(self, item_type):
+        self._filter_after_ids.pop(item_type, None)
+        self.filter_items(item_type, self.get_filter_text(item_type))
 
     def add_placeholder(self, entry, placeholder):
         entry.insert(0, placeholder)
@@ -682,46 +2484,116 @@ class StratusGUI:
         entry._item_type = placeholder.split()[1].lower()  # e.g., "projects", "packages", "assemblies"
 
     def on_tab_changed(self, event):
-        """Fetch data for new tabs when selected."""
+        """Fetch data for new tabs when selected, revalidating tabs marked stale by a refresh."""
         selected_tab = self.notebook.index(self.notebook.select())
-        tab_name = self.notebook.tab(selected_tab, "text")
-        if tab_name == "Activity Logs" and not self.tab_data_fetched["activity_logs"]:
-            self.fetch_activity_logs()
-            self.tab_data_fetched["activity_logs"] = True
-        elif tab_name == "Users" and not self.tab_data_fetched["users"]:
-            self.fetch_users()
-            self.tab_data_fetched["users"] = True
-        elif tab_name == "Containers" and not self.tab_data_fetched["containers"]:
-            self.fetch_containers()
-            self.tab_data_fetched["containers"] = True
-        elif tab_name == "API Health" and not self.tab_data_fetched["health"]:
-            self.fetch_health()
-            self.tab_data_fetched["health"] = True
-        elif tab_name == "Tracking Statuses" and not self.tab_data_fetched["tracking_statuses"]:
-            self.fetch_tracking_statuses()
-            self.tab_data_fetched["tracking_statuses"] = True
-
-    def fetch_projects(self) -> None:
+        tab_key = LAZY_TABS.get(self.notebook.tab(selected_tab, "text"))
+        if tab_key is None or self.tab_data_fetched[tab_key]:
+            return
+        fetch = {
+            "activity_logs": self.fetch_activity_logs,
+            "users": self.fetch_users,
+            "containers": self.fetch_containers,
+            "health": self.fetch_health,
+            "tracking_statuses": self.fetch_tracking_statuses,
+        }[tab_key]
+        fetch(revalidate=tab_key in self.stale_tabs)
+        self.stale_tabs.discard(tab_key)
+        self.tab_data_fetched[tab_key] = True
+
+    def update_rate_status(self):
+        tokens, blocked_for = RATE_LIMITER.state()
+        if blocked_for:
+            self.rate_status_label.configure(text=f"API paused (rate limited): resuming in {math.ceil(blocked_for)}s",
+                                             foreground="red")
+        else:
+            self.rate_status_label.configure(text=f"API rate: {max(tokens, 0):.0f}/{RATE_LIMITER.burst} requests available",
+                                             foreground="gray" if tokens >= 1 else "orange")
+        self.root.after(RATE_STATUS_REFRESH_MS, self.update_rate_status)
+
+    def poll_notifications(self):
+        latest = None
+        while True:
+            try:
+                level, title, message, timestamp = _notification_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest = self.notifications.add(level, title, message, timestamp)
+        if latest is not None:
+            first_line = latest["message"].splitlines()[0] if latest["message"] else ""
+            text = f"{latest['title']}: {first_line}"
+            if latest["count"] > 1:
+                text += f" (x{latest['count']})"
+            self.status_message.configure(text=text, foreground=NOTIFICATION_COLORS.get(latest["level"], "gray"))
+            self.notifications_button.configure(text=f"Notifications ({len(self.notifications)})")
+            if self.notifications_window is not None and self.notifications_window.winfo_exists():
+                self.refresh_notifications_table()
+        self.root.after(NOTIFICATION_POLL_MS, self.poll_notifications)
+
+    def show_notifications(self):
+        if self.notifications_window is not None and self.notifications_window.winfo_exists():
+            self.notifications_window.lift()
+            return
+        self.notifications_window = Toplevel(self.root)
+        self.notifications_window.title("Notifications")
+        self.notifications_window.geometry("900x400")
+        frame = tb.Frame(self.notifications_window, padding="10")
+        frame.pack(fill="both", expand=True)
+        table_frame = tb.Frame(frame)
+        table_frame.pack(fill="both", expand=True)
+        self.notifications_table = self.create_table_with_scrollbars(
+            table_frame,
+            columns=("last", "level", "title", "count", "message"),
+            column_widths=[140, 70, 120, 50, 500],
+            heading_map={"last": "Time", "count": "Count"},
+            stretch_columns=["message"]
+        )
+        tb.Button(frame, text="Clear", command=self.clear_notifications, bootstyle="primary").pack(anchor="e", pady=(8, 0))
+        self.refresh_notifications_table()
+
+    def refresh_notifications_table(self):
+        self.clear_table(self.notifications_table)
+        for entry in reversed(self.notifications.entries.values()):
+            last = datetime.fromtimestamp(entry["last"]).strftime("%Y-%m-%d %H:%M:%S")
+            self.notifications_table.insert("", "end", values=(last, entry["level"], entry["title"], entry["count"],
+                                                               entry["message"].replace("\n", " ")))
+
+    def clear_notifications(self):
+        self.notifications.clear()
+        self.status_message.configure(text="Ready", foreground="gray")
+        self.notifications_button.configure(text="Notifications (0)")
+        if self.notifications_window is not None and self.notifications_window.winfo_exists():
+            self.refresh_notifications_table()
+
+    def on_busy_change(self, busy):
+        self.root.config(cursor="wait" if busy else "")
+
+    def fetch_projects(self, on_loaded=None, revalidate=False) -> None:
         """Fetch the list of projects from the API and update the dropdown."""
-        self.root.config(cursor="wait")
-        self.root.update()
-        try:
-            params = {"include": "id,name", "pagesize": PAGE_SIZE, "disabletotal": True}
-            response = make_api_request(f"{BASE_URL}{ENDPOINTS['project']}", self.headers, params, "Fetch projects")
-            self.all_projects = response.json().get("data", [])
+        params = {"include": "id,name", "pagesize": PAGE_SIZE, "disabletotal": True}
+
+        def load():
+            response = self.client.get(f"{BASE_URL}{ENDPOINTS['project']}", params, "Fetch projects",
+                                       revalidate=revalidate)
+            return response.json().get("data", [])
+
+        def show(projects):
+            self.all_projects = projects
             if not self.all_projects:
                 messagebox.showwarning("No Projects", "No projects found.")
                 self.project_dropdown.configure(state="disabled")
                 return
+            self.project_dropdown.configure(state="readonly")
             self.projects = self.all_projects
             project_names = ["Choose Project"] + [p.get("name", "Unnamed") for p in self.projects]
             self.project_dropdown["values"] = project_names
             self.project_dropdown.current(0)
-        except RequestException:
+            if on_loaded:
+                on_loaded()
+
+        def failed(e):
             self.project_dropdown.configure(state="disabled")
-        finally:
-            self.root.config(cursor="")
-            self.root.update()
+
+        self.dispatcher.submit("projects", load, on_success=show, on_error=failed)
 
     def fetch_packages(self, event):
         project_index = self.project_dropdown.current()
@@ -735,36 +2607,139 @@ class StratusGUI:
             self.clear_tables_and_fields()
             self.selected_package_id = None
 
-    def fetch_packages_by_id(self, project_id):
-        self.clear_tables_and_fields()
+    def current_project_id(self):
+        index = self.project_dropdown.current()
+        return self.projects[index - 1].get("id") if 0 < index <= len(self.projects) else None
+
+    def fetch_packages_by_id(self, project_id, on_loaded=None, merge=False):
+        """Load a project's packages; with merge, keep the tables and selection and update them in place."""
+        self.cancel_assembly_counts()
+        if not merge:
+            self.clear_tables_and_fields()
+            self.dispatcher.cancel("assemblies", "package_attachments", "assembly_attachments")
+            self.all_packages = self.packages = []
         params = {
             "include": ("id,name,description,number,categoryId,hoursEstimatedField,"
                         "hoursEstimatedOffice,hoursEstimatedPurchasing,hoursEstimatedShop,"
                         "officeDuration,purchasingDuration,shopDuration,installedDT,"
-                        "officeStartDT,purchasingStartDT,requiredDT,startDT,status"),
+                        "officeStartDT,purchasingStartDT,requiredDT,startDT,status,modifiedDT"),
             "where": f"projectId eq '{project_id}'",
             "page": 0,
             "pagesize": PAGE_SIZE,
             "disabletotal": True
         }
-        self.all_packages = list(self.paginated_api_fetch(f"{BASE_URL}{ENDPOINTS['package']}", params, "Fetch packages"))
-        for pkg in self.all_packages:
-            pkg["assembly_count"] = self.get_assembly_count(pkg.get("id"))
-        self.packages = self.all_packages
-        self.update_table("packages")
-        if not self.packages:
-            messagebox.showinfo("No Packages", f"No packages found for Project ID {project_id}.")
-
-    def get_assembly_count(self, package_id):
+
+        def load():
+            packages = self.sync_packages(project_id, params)
+            return packages, SearchIndex(packages)
+
+        def show(result):
+            packages, search_index = result
+            for pkg in packages:
+                count = self.assembly_count_cache.get(pkg.get("id"))
+                if count is not None:
+                    pkg["assembly_count"] = count
+            self.all_packages = packages
+            self.search_indexes["packages"] = search_index
+            self.packages = self.filter_source("packages", self.get_filter_text("packages")) if merge else packages
+            self.update_table("packages", on_done=on_loaded)
+            if not self.all_packages:  # Not self.packages: a refresh keeps the filter applied
+                messagebox.showinfo("No Packages", f"No packages found for Project ID {project_id}.")
+
+        self.dispatcher.submit("packages", load, on_success=show)
+
+    def sync_packages(self, project_id, params):
+        """Return the project's packages, fetching only those modified since the last sync.
+
+        Runs on a worker. Falls back to a full fetch when nothing is stored, the last
+        full sync is older than PACKAGE_FULL_SYNC_INTERVAL, or the API rejects the
+        modifiedDT filter.
+        """
+        url = f"{BASE_URL}{ENDPOINTS['package']}"
+        stored = self.package_store.load(project_id)
+        if stored is not None:
+            packages, watermark, full_sync = stored
+            if watermark and time.time() - full_sync < PACKAGE_FULL_SYNC_INTERVAL:
+                delta_params = dict(params, where=f"{params['where']} and modifiedDT ge '{watermark}'")
+                try:
+                    changed = list(self.paginated_api_fetch(url, delta_params, "Fetch changed packages",
+                                                            raise_errors=True))
+                except HTTPError as e:
+                    if e.response.status_code != 400:
+                        raise
+                    logging.warning(f"Delta package sync rejected, falling back to a full fetch: {e}")
+                else:
+                    if job_cancelled():
+                        return packages
+                    by_id = {pkg.get("id"): pkg for pkg in packages}
+                    for pkg in changed:
+                        by_id[pkg.get("id")] = pkg  # Existing packages keep their position
+                    if changed:
+                        self.package_store.update(project_id, changed)
+                    return list(by_id.values())
+        try:
+            packages = list(self.paginated_api_fetch(url, params, "Fetch packages", raise_errors=True))
+        except RequestException:
+            if stored is None:
+                raise
+            return stored[0]  # Show the last synced copy rather than nothing
+        if not job_cancelled():
+            self.package_store.replace(project_id, packages)
+        return packages
+
+    def cancel_assembly_counts(self):
+        for job in self.assembly_count_jobs:
+            job.cancel()
+        self.assembly_count_jobs = []
+        self.assembly_counts_requested = set()
+
+    def schedule_visible_assembly_counts(self, event=None):
+        if self._count_after_id is not None:
+            self.root.after_cancel(self._count_after_id)
+        self._count_after_id = self.root.after(COUNT_SCROLL_DEBOUNCE_MS, self.fetch_visible_assembly_counts)
+
+    def fetch_visible_assembly_counts(self):
+        """Fetch assembly counts for the package rows currently scrolled into view.
+
+        Cached counts are already displayed; they are revalidated once per project load.
+        """
+        self._count_after_id = None
+        total = len(self.packages)
+        if not total or len(self.package_table.get_children()) != total:
+            return
+        top, bottom = self.package_table.yview()
+        start = int(top * total)
+        end = min(total, int(math.ceil(bottom * total)) + 1, start + MAX_VISIBLE_COUNT_ROWS)
+        pending = [pkg for pkg in self.packages[start:end]
+                   if pkg.get("id") and pkg.get("id") not in self.assembly_counts_requested]
+        if not pending:
+            return
+        self.assembly_counts_requested.update(pkg.get("id") for pkg in pending)
+
+        def set_count(pkg, count):
+            pkg["assembly_count"] = count
+            self.assembly_count_cache.set(pkg.get("id"), count)
+            row = self.package_table._id_index.get(str(pkg.get("id")))
+            if row and self.package_table.exists(row):
+                self.package_table.set(row, "assembly_count", count)
+
+        job = self.dispatcher.submit_async_each(None, lambda pkg: self.get_assembly_count(pkg.get("id")),
+                                                pending, set_count, on_done=self.assembly_count_cache.save,
+                                                max_concurrency=ASSEMBLY_COUNT_CONCURRENCY)
+        self.assembly_count_jobs.append(job)
+
+    async def get_assembly_count(self, package_id):
         if not package_id:
             return 0
         params = {"include": "id", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
         total_count = 0
-        for _ in self.paginated_api_fetch(f"{BASE_URL}/v2/package/{package_id}/assemblies", params, f"Fetch assembly count for package {package_id}"):
+        # A failed page must not be cached as a short count, so let submit_async_each skip the package
+        async for _ in self.async_client.paginate(f"{BASE_URL}/v2/package/{package_id}/assemblies", params,
+                                                  f"Fetch assembly count for package {package_id}", raise_errors=True):
             total_count += 1
         return total_count
 
-    def fetch_activity_logs(self):
+    def fetch_activity_logs(self, revalidate=False):
         """Fetch activity logs with properties matching the table columns."""
         params = {
             "include": (
@@ -777,10 +2752,15 @@ class StratusGUI:
             "disabletotal": True,
             "where": "createdDT ge DateTime.Now.AddDays(-30)"
         }
-        try:
-            response = make_api_request(f"{BASE_URL}{ENDPOINTS['activity']}", self.headers, params, "Fetch activity logs")
-            self.activity_logs = response.json().get("data", [])
-            self.clear_table(self.activity_table)
+
+        def load():
+            response = self.client.get(f"{BASE_URL}{ENDPOINTS['activity']}", params, "Fetch activity logs",
+                                       revalidate=revalidate)
+            return response.json().get("data", [])
+
+        def show(activity_logs):
+            self.activity_logs = activity_logs
+            rows = []
             for log in self.activity_logs:
                 created_dt = log.get("createdDT", "")
                 if created_dt:
@@ -810,52 +2790,65 @@ class StratusGUI:
                     log.get("trackingStatusColor", ""),
                     log.get("stationName", "")
                 )
-                self.activity_table.insert("", "end", values=values)
+                # Log entries have no id; identical entries are interchangeable
+                rows.append(("|".join(str(v) for v in values), values))
+            self.merge_table_rows(self.activity_table, rows)
             if not self.activity_logs:
                 messagebox.showinfo("No Activity Logs", "No activity logs found.")
-        except RequestException as e:
-            messagebox.showerror("Error", f"Failed to fetch activity logs: {e}")
-        
-    def fetch_users(self):
+
+        def failed(e):
+            notify("error", "Activity Logs", f"Failed to fetch activity logs: {e}")
+
+        self.dispatcher.submit("activity_logs", load, on_success=show, on_error=failed)
+
+    def fetch_users(self, revalidate=False):
         params = {"include": "id,firstName,lastName,email,status", "pagesize": PAGE_SIZE, "disabletotal": True}
-        try:
-            response = make_api_request(f"{BASE_URL}{ENDPOINTS['user']}", self.headers, params, "Fetch users")
-            self.users = response.json().get("data", [])
-            self.clear_table(self.users_table)
-            for user in self.users:
-                status = "Active" if user.get("status") == 1 else "Disabled"
-                self.users_table.insert("", "end",
-                                        values=(user.get("firstName", ""),
-                                                user.get("lastName", ""),
-                                                user.get("email", ""),
-                                                status))
+
+        def load():
+            response = self.client.get(f"{BASE_URL}{ENDPOINTS['user']}", params, "Fetch users", revalidate=revalidate)
+            return response.json().get("data", [])
+
+        def show(users):
+            self.users = users
+            self.merge_table_rows(self.users_table, [
+                (user.get("id", ""), (user.get("firstName", ""),
+                                      user.get("lastName", ""),
+                                      user.get("email", ""),
+                                      "Active" if user.get("status") == 1 else "Disabled"))
+                for user in self.users])
             if not self.users:
                 messagebox.showinfo("No Users", "No users found.")
-        except RequestException as e:
+
+        def failed(e):
             logging.error(f"Error fetching users: {e}")
-            messagebox.showerror("Error", f"Failed to fetch users: {e}")
+            notify("error", "Users", f"Failed to fetch users: {e}")
+
+        self.dispatcher.submit("users", load, on_success=show, on_error=failed)
 
-    def fetch_containers(self):
+    def fetch_containers(self, revalidate=False):
         params = {"include": "id,name,description", "pagesize": PAGE_SIZE, "disabletotal": True}
-        try:
-            response = make_api_request(f"{BASE_URL}/v1/container", self.headers, params, "Fetch containers")
-            self.containers = response.json().get("data", [])
-            self.clear_table(self.containers_table)
-            for container in self.containers:
-                self.containers_table.insert("", "end",
-                                             values=(container.get("name", ""),
-                                                     container.get("description", "")))
+
+        def load():
+            response = self.client.get(f"{BASE_URL}/v1/container", params, "Fetch containers", revalidate=revalidate)
+            return response.json().get("data", [])
+
+        def show(containers):
+            self.containers = containers
+            self.merge_table_rows(self.containers_table, [
+                (container.get("id", ""), (container.get("name", ""), container.get("description", "")))
+                for container in self.containers])
             if not self.containers:
                 messagebox.showinfo("No Containers", "No containers found.")
-        except RequestException:
-            pass
 
-    def fetch_health(self):
+        self.dispatcher.submit("containers", load, on_success=show, on_error=lambda e: None)
+
+    def fetch_health(self, revalidate=False):
         """Fetch API health data from the /health endpoint."""
-        try:
-            response = make_api_request(f"{BASE_URL}/health", self.headers, {}, "Fetch API health")
-            data = response.json()
+        def load():
+            response = self.client.get(f"{BASE_URL}/health", {}, "Fetch API health", revalidate=revalidate)
+            return response.json()
 
+        def show(data):
             # Clear existing table data
             self.clear_table(self.health_table)
 
@@ -868,8 +2861,8 @@ class StratusGUI:
                 self.health_table.column("key", width=200)
                 self.health_table.column("value", width=300)
                 self.health_data = [{"key": k, "value": str(v)} for k, v in data.items()]
-                for item in self.health_data:
-                    self.health_table.insert("", "end", values=(item["key"], item["value"]))
+                self.merge_table_rows(self.health_table, [(item["key"], (item["key"], item["value"]))
+                                                          for item in self.health_data])
             elif isinstance(data, list) and data:
                 # List of objects: use keys from the first object as columns
                 columns = list(data[0].keys())
@@ -878,9 +2871,8 @@ class StratusGUI:
                     self.health_table.heading(col, text=col.replace("_", " ").title())
                     self.health_table.column(col, width=150)  # Default width
                 self.health_data = data
-                for item in self.health_data:
-                    values = [str(item.get(col, "")) for col in columns]
-                    self.health_table.insert("", "end", values=values)
+                self.merge_table_rows(self.health_table, [(i, [str(item.get(col, "")) for col in columns])
+                                                          for i, item in enumerate(self.health_data)])
             else:
                 messagebox.showinfo("No Health Data", "No health data found.")
                 self.health_data = []
@@ -888,56 +2880,67 @@ class StratusGUI:
             if not self.health_data:
                 messagebox.showinfo("No Health Data", "No health data found.")
 
-        except RequestException:
+        def failed(e):
             self.clear_table(self.health_table)
             self.health_data = []
-            messagebox.showerror("Error", "Failed to fetch API health data.")
-            
-    def fetch_tracking_statuses(self):
+            notify("error", "API Health", "Failed to fetch API health data.")
+
+        self.dispatcher.submit("health", load, on_success=show, on_error=failed)
+
+    def fetch_tracking_statuses(self, revalidate=False):
         """Fetch tracking statuses data from the /v1/company/tracking-statuses endpoint."""
         params = {"include": "id,name,description,color,sequenceNumber,canAddToAssembly", 
                   "pagesize": PAGE_SIZE, "disabletotal": True}          
 
-        try:
-            response = make_api_request(f"{BASE_URL}/v1/company/tracking-statuses", 
-                                      self.headers, params, "Fetch tracking statuses")
+        def load():
+            response = self.client.get(f"{BASE_URL}/v1/company/tracking-statuses", params, "Fetch tracking statuses",
+                                       revalidate=revalidate)
+            return response.json()
+
+        def show(data):
             # Debug: Log raw response to inspect data
-            data = response.json()
             logging.debug(f"Tracking Statuses Response: {data}")
             # Handle case where response is a list directly
             if isinstance(data, list):
                 self.tracking_statuses = data
             else:
                 self.tracking_statuses = data.get("data", []) if isinstance(data, dict) else []
-            self.clear_table(self.tracking_statuses_table)
-            for status in self.tracking_statuses:
-                self.tracking_statuses_table.insert("", "end",
-                                                  values=(status.get("name", "N/A"),
-                                                          status.get("description", "N/A"),
-                                                          status.get("color", "N/A"),
-                                                          status.get("sequenceNumber", 0),
-                                                          str(status.get("canAddToAssembly", False))))
+            self.merge_table_rows(self.tracking_statuses_table, [
+                (status.get("id", ""), (status.get("name", "N/A"),
+                                        status.get("description", "N/A"),
+                                        status.get("color", "N/A"),
+                                        status.get("sequenceNumber", 0),
+                                        str(status.get("canAddToAssembly", False))))
+                for status in self.tracking_statuses])
             if not self.tracking_statuses:
                 messagebox.showinfo("No Tracking Statuses", "No tracking statuses found.")
-        except RequestException as e:
+
+        def failed(e):
             self.clear_table(self.tracking_statuses_table)
             self.tracking_statuses = []
-            messagebox.showerror("Error", f"Failed to fetch tracking statuses data: {e}")
-            
-    def on_package_select(self, event):
+            notify("error", "Tracking Statuses", f"Failed to fetch tracking statuses data: {e}")
+
+        self.dispatcher.submit("tracking_statuses", load, on_success=show, on_error=failed)
+
+
+    def on_package_select(self, event, on_assemblies_loaded=None):
         selected = self.package_table.selection()
         if not selected:
             self.clear_tables_and_fields()
             self.selected_package_id = None
             return
-        self.selected_package_id = self.package_table.item(selected[0])["tags"][0]
+        package_id = self.package_table.item(selected[0])["tags"][0]
+        if event is not None and package_id == self.selected_package_id:
+            return  # Already loaded by filter_items/refresh_tables
+        self.selected_package_id = package_id
+        self.dispatcher.cancel("assembly_attachments")
         for pkg in self.packages:
             if pkg.get("id") == self.selected_package_id:
                 self.package_data = pkg
                 break
         self.update_properties_fields()
         self.fetch_package_attachments()
-        self.fetch_assemblies()
+        self.fetch_assemblies(on_loaded=on_assemblies_loaded)
 
     def update_properties_fields(self):
         self.initial_field_values = {}
@@ -955,12 +2958,19 @@ class StratusGUI:
             self.clear_table(self.package_attachment_table)
             self.package_no_attachments_label.place_forget()
             return
+        package_id = self.selected_package_id
+        cache_key = ("package", package_id)
         params = {"include": "id,fileName,createdDT", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
-        try:
-            response = make_api_request(f"{BASE_URL}/v1/package/{self.selected_package_id}/attachments",
-                                        self.headers, params, "Fetch package attachments")
-            self.package_attachments = response.json().get("data", [])
-            self.clear_table(self.package_attachment_table)
+
+        def load():
+            response = self.client.get(f"{BASE_URL}/v1/package/{package_id}/attachments", params, "Fetch package attachments")
+            attachments = response.json().get("data", [])
+            self.attachment_cache.put(cache_key, attachments)
+            return attachments
+
+        def show(attachments):
+            self.package_attachments = attachments
+            rows = []
             for att in self.package_attachments:
                 created_dt = att.get("createdDT", "")
                 if created_dt:
@@ -968,41 +2978,73 @@ class StratusGUI:
                         created_dt = datetime.fromisoformat(created_dt.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
                     except ValueError:
                         pass
-                self.package_attachment_table.insert("", "end", values=(att.get("fileName", ""), created_dt),
-                                                     tags=(att.get("id", ""),))
+                rows.append((att.get("id", ""), (att.get("fileName", ""), created_dt)))
+            self.merge_table_rows(self.package_attachment_table, rows)
             self.package_no_attachments_label.place(relx=0.5, rely=0.5, anchor="center") if not self.package_attachments else self.package_no_attachments_label.place_forget()
-        except RequestException:
+
+        def failed(e):
             self.clear_table(self.package_attachment_table)
             self.package_no_attachments_label.place_forget()
 
-    def fetch_assemblies(self):
+        cached = self.attachment_cache.get(cache_key)
+        if cached is not None:
+            self.dispatcher.cancel("package_attachments")
+            show(cached)
+            return
+        self.dispatcher.submit("package_attachments", load, on_success=show, on_error=failed)
+
+    def fetch_assemblies(self, on_loaded=None):
         if not self.selected_package_id:
+            self.dispatcher.cancel("assemblies")
             self.clear_table(self.assembly_table)
             self.clear_table(self.assembly_attachment_table)
             self.assembly_no_attachments_label.place_forget()
             return
-        params = {"include": "id,name,description", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
-        self.all_assemblies = list(self.paginated_api_fetch(f"{BASE_URL}/v2/package/{self.selected_package_id}/assemblies", params, "Fetch assemblies"))
-        self.assemblies = self.all_assemblies
-        self.update_table("assemblies")
-        if not self.assemblies:
-            messagebox.showinfo("No Assemblies", f"No assemblies found for Package ID {self.selected_package_id}.")
+        package_id = self.selected_package_id
+        params = {"include": "id,name,description,number,categoryId",  # number/categoryId feed SearchIndex
+                  "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
+
+        def load():
+            assemblies = list(self.paginated_api_fetch(f"{BASE_URL}/v2/package/{package_id}/assemblies", params,
+                                                       "Fetch assemblies"))
+            return assemblies, SearchIndex(assemblies)
+
+        def show(result):
+            assemblies, search_index = result
+            self.all_assemblies = assemblies
+            self.search_indexes["assemblies"] = search_index
+            self.assemblies = self.all_assemblies
+            self.update_table("assemblies", on_done=on_loaded)
+            if not self.assemblies:
+                messagebox.showinfo("No Assemblies", f"No assemblies found for Package ID {package_id}.")
+
+        self.dispatcher.submit("assemblies", load, on_success=show)
 
     def fetch_assembly_attachments(self, event):
         """Fetch attachments for the selected assembly."""
         selected = self.assembly_table.selection()
         if not selected:
+            self.dispatcher.cancel("assembly_attachments")
             self.clear_table(self.assembly_attachment_table)
             self.selected_assembly_id = None
             self.assembly_no_attachments_label.place_forget()
             return
-        self.selected_assembly_id = self.assembly_table.item(selected[0])["tags"][0]
+        assembly_id = self.assembly_table.item(selected[0])["tags"][0]
+        if event is not None and assembly_id == self.selected_assembly_id:
+            return  # Already loaded by filter_items/refresh_tables
+        self.selected_assembly_id = assembly_id
+        cache_key = ("assembly", assembly_id)
         params = {"include": "id,fileName,createdDT", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
-        try:
-            response = make_api_request(f"{BASE_URL}/v1/assembly/{self.selected_assembly_id}/attachments",
-                                        self.headers, params, "Fetch assembly attachments")
-            self.assembly_attachments = response.json().get("data", [])
-            self.clear_table(self.assembly_attachment_table)
+
+        def load():
+            response = self.client.get(f"{BASE_URL}/v1/assembly/{assembly_id}/attachments", params, "Fetch assembly attachments")
+            attachments = response.json().get("data", [])
+            self.attachment_cache.put(cache_key, attachments)
+            return attachments
+
+        def show(attachments):
+            self.assembly_attachments = attachments
+            rows = []
             for att in self.assembly_attachments:
                 created_dt = att.get("createdDT", "")
                 if created_dt:
@@ -1010,13 +3052,21 @@ class StratusGUI:
                         created_dt = datetime.fromisoformat(created_dt.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
                     except ValueError:
                         pass
-                self.assembly_attachment_table.insert("", "end", values=(att.get("fileName", ""), created_dt),
-                                                      tags=(att.get("id", ""),))
+                rows.append((att.get("id", ""), (att.get("fileName", ""), created_dt)))
+            self.merge_table_rows(self.assembly_attachment_table, rows)
             self.assembly_no_attachments_label.place(relx=0.5, rely=0.5, anchor="center") if not self.assembly_attachments else self.assembly_no_attachments_label.place_forget()
-        except RequestException:
+
+        def failed(e):
             self.clear_table(self.assembly_attachment_table)
             self.assembly_no_attachments_label.place_forget()
 
+        cached = self.attachment_cache.get(cache_key)
+        if cached is not None:
+            self.dispatcher.cancel("assembly_attachments")
+            show(cached)
+            return
+        self.dispatcher.submit("assembly_attachments", load, on_success=show, on_error=failed)
+
     def check_property_changes(self, event=None):
         changed = any(var.get() != self.initial_field_values.get(key, "") for key, var in self.property_fields.items())
         self.unsaved_alert.grid() if changed else self.unsaved_alert.grid_remove()
@@ -1060,26 +3110,79 @@ class StratusGUI:
         if not package_changed:
             messagebox.showinfo("No Changes", "No changes to apply.")
             return
-        try:
-            response = requests.patch(f"{BASE_URL}/v2/package/properties", headers=self.headers,
-                                     json=package_patch_data, timeout=10)
+        package_id = self.selected_package_id
+
+        def patch():
+            response = self.client.request("PATCH", f"{BASE_URL}/v2/package/properties", json=package_patch_data)
             response.raise_for_status()
-            for key, value in package_patch_data.items():
-                if key != "id":
-                    self.package_data[key] = value
+
+        def applied(_):
+            changes = {key: value for key, value in package_patch_data.items() if key != "id"}
+            self.update_package_row(package_id, changes)
             messagebox.showinfo("Success", "Package properties updated successfully.")
-            project_id = self.projects[self.project_dropdown.current() - 1]["id"] if self.project_dropdown.current() > 0 else None
-            if project_id:
-                self.fetch_packages_by_id(project_id)
-                for item in self.package_table.get_children():
-                    if self.package_table.item(item)["tags"][0] == self.selected_package_id:
-                        self.package_table.selection_set(item)
-                        break
-            self.update_properties_fields()
-            self.check_property_changes()
-        except RequestException as e:
+            if self.selected_package_id == package_id:
+                self.update_properties_fields()
+                self.check_property_changes()
+            self.verify_package_changes(package_id, changes)
+
+        def failed(e):
             handle_request_error(e, "Failed to apply properties")
 
+        self.dispatcher.submit("apply_properties", patch, on_success=applied, on_error=failed)
+
+    def update_package_row(self, package_id, values):
+        """Patch one package in place and redraw only its row; the store copy is updated too."""
+        package = next((pkg for pkg in self.all_packages if pkg.get("id") == package_id), None)
+        if package is None:
+            return
+        package.update(values)
+        index = self.search_indexes.get("packages")
+        if index is not None and index.source is self.all_packages:
+            index.reindex(package)
+        if self.selected_package_id == package_id:
+            self.package_data = package
+        item = self.package_table._id_index.get(str(package_id))
+        if item is not None and self.package_table.exists(item):
+            self.package_table.item(item, values=(package.get("name", ""), package.get("assembly_count", ""),
+                                                  package.get("description", "")))
+        project_id = self.current_project_id()
+        if project_id:
+            self.package_store.put(project_id, package)
+
+    def verify_package_changes(self, package_id, changes):
+        """Re-read only the patched fields in the background and adopt the server's values if they differ."""
+        params = {"include": ",".join(["id", "modifiedDT", *changes]), "where": f"id eq '{package_id}'",
+                  "page": 0, "pagesize": 1, "disabletotal": True}
+
+        def same(expected, actual):
+            if isinstance(expected, str) and isinstance(actual, str):
+                try:
+                    return (datetime.fromisoformat(expected.replace("Z", "+00:00")) ==
+                            datetime.fromisoformat(actual.replace("Z", "+00:00")))
+                except ValueError:
+                    pass
+            return (expected or None) == (actual or None)
+
+        def load():
+            response = self.client.get(f"{BASE_URL}{ENDPOINTS['package']}", params, "Verify package changes")
+            data = response.json().get("data", [])
+            return data[0] if data else None
+
+        def verified(server):
+            if server is None:
+                notify("warning", "Verify package changes", f"Package {package_id} was not found after the update.")
+                return
+            mismatched = [key for key, value in changes.items() if not same(value, server.get(key))]
+            if mismatched:
+                notify("warning", "Verify package changes",
+                       f"Server kept different values for: {', '.join(mismatched)}.")
+            self.update_package_row(package_id, {key: server.get(key) for key in ("modifiedDT", *mismatched)})
+            unsaved = any(var.get() != self.initial_field_values.get(key, "") for key, var in self.property_fields.items())
+            if mismatched and self.selected_package_id == package_id and not unsaved:
+                self.update_properties_fields()
+
+        self.dispatcher.submit(None, load, on_success=verified)
+
     def download_attachments(self, attachments, table, selection_only=False):
         if selection_only:
             selected = table.selection()
@@ -1093,13 +3196,285 @@ class StratusGUI:
                 return
             items = [{"tags": (att.get("id", ""),), "values": (att.get("fileName", f"attachment_{att.get('id', '')}"),)} for att in attachments]
 
+        if self.download_as_zip.get():
+            self.download_attachments_to_zip(items)
+            return
         save_dir = filedialog.askdirectory(title="Select Download Directory")
         if not save_dir:
             return
-        for item in items:
-            att_id = item["tags"][0]
-            file_name = item["values"][0] or f"attachment_{att_id}"
-            self.download_attachment(att_id, file_name, save_dir)
+        # Attachments sharing a fileName (re-uploaded revisions) would otherwise share one .part file,
+        # as would a file still downloading into the same folder from an earlier batch
+        used = {os.path.basename(state["path"]).lower() for state in self.download_rows.values()
+                if state["status"] not in ("Done", "Failed", "Cancelled")
+                and os.path.normcase(os.path.dirname(state["path"])) == os.path.normcase(save_dir)}
+        self.start_downloads([(item["tags"][0], unique_filename(item["values"][0] or f"attachment_{item['tags'][0]}", used),
+                               save_dir) for item in items])
+
+    def download_attachments_to_zip(self, items):
+        """Stream the attachments straight into one ZIP archive, one entry at a time, with no temporary files."""
+        zip_path = filedialog.asksaveasfilename(title="Save Attachments As", defaultextension=".zip",
+                                                filetypes=[("ZIP archive", "*.zip")])
+        if not zip_path:
+            return
+        try:
+            archive = zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to create {zip_path}: {e}")
+            return
+        lock = threading.Lock()
+        names = set()  # Entries must be unique within the archive
+        files = [(item["tags"][0], unique_filename(item["values"][0] or f"attachment_{item['tags'][0]}", names), zip_path)
+                 for item in items]
+
+        def write_entry(att_id, file_name, _, progress, cancelled):
+            with lock:
+                if archive.fp is None:  # Closed after a cancel
+                    return "Cancelled"
+                return self.download_attachment_to_zip(archive, att_id, file_name, progress, cancelled)
+
+        def done():
+            with lock:
+                archive.close()
+
+        # Entries cannot be interleaved, so the archive is written by a single worker
+        self.start_downloads(files, on_done=done, download=write_entry, workers=1)
+
+    def download_attachment_to_zip(self, archive, att_id, file_name, progress=None, cancelled=None):
+        """Stream one attachment into an open archive entry; return "Done", "Failed" or "Cancelled".
+
+        Only one DOWNLOAD_CHUNK_SIZE buffer is held at a time. A dropped connection
+        continues the same entry with a Range request; if the server cannot resume,
+        the entry is dropped and fetched again from the start. Failed and cancelled
+        entries are dropped too, so the archive never holds a truncated file.
+        """
+        def fill(entry):
+            """Write the attachment into entry; return (status, error), status "Restart" if it cannot resume."""
+            def copy_blob(blob):
+                with open(blob, "rb") as f:
+                    shutil.copyfileobj(f, entry, DOWNLOAD_CHUNK_SIZE)
+
+            size = self.attachment_store.use(att_id, copy_blob)
+            if size is not None:
+                if progress:
+                    progress(size, size)
+                return "Done", None
+            done = 0
+            total = None
+            restart = None
+
+            def attempt():
+                """One request, continuing the entry from the bytes already written."""
+                nonlocal done, total, restart
+                headers = {"Accept-Encoding": "identity"}
+                if done:
+                    headers["Range"] = f"bytes={done}-"
+                with self.client.request("GET", f"{BASE_URL}/v1/attachment/{att_id}/download",
+                                         headers=headers, stream=True) as response:
+                    response.raise_for_status()
+                    if done and response.status_code != 206:
+                        restart = ValueError("the server cannot resume this download")
+                        return "Restart"
+                    if total is None:
+                        total = int(response.headers.get("Content-Length", 0)) or None
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if cancelled is not None and cancelled.is_set():
+                            return "Cancelled"
+                        if chunk:
+                            entry.write(chunk)
+                            done += len(chunk)
+                            if progress:
+                                progress(done, total)
+                if total is not None and done != total:
+                    raise ValueError(f"expected {total} bytes, received {done}")
+                return "Done"
+
+            status, error = run_transfer(attempt, DOWNLOAD_RETRIES, cancelled)
+            return status, restart if status == "Restart" else error
+
+        status, error = "Failed", None
+        for _ in range(2):  # One full re-fetch when the server ignores Range
+            entries = len(archive.filelist)
+            try:
+                with archive.open(file_name, "w", force_zip64=True) as entry:
+                    status, error = fill(entry)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                status, error = "Failed", e
+            if status != "Done" and len(archive.filelist) > entries:
+                self.drop_zip_entry(archive)
+            if status != "Restart":
+                break
+        if status in ("Failed", "Restart"):
+            notify("error", "Download", f"Failed to add attachment {file_name} to {archive.filename}: {error}")
+            return "Failed"
+        return status
+
+    @staticmethod
+    def drop_zip_entry(archive):
+        """Remove the entry written last, truncating the archive back to where that entry began."""
+        info = archive.filelist.pop()
+        archive.NameToInfo.pop(info.filename, None)
+        archive.fp.seek(info.header_offset)
+        archive.fp.truncate()
+        archive.start_dir = info.header_offset  # Where close() writes the central directory
+
+    def start_downloads(self, files, on_file_done=None, on_done=None, download=None, workers=None):
+        """Download (att_id, file_name, save_dir) tuples on the shared transfer pool.
+
+        download(att_id, file_name, save_dir, progress, cancelled) replaces download_attachment
+        for each file; workers gives the batch a private pool of that size instead.
+        """
+        self.show_downloads()
+        if not any(batch.pending for batch in self.download_batches):
+            for batch in self.download_batches:
+                batch.close()
+            self.clear_table(self.downloads_table)
+            self.download_rows = {}
+            self.download_batches = []
+        download = download or self.download_attachment
+        if workers is None:
+            batch = DownloadBatch(self.transfer_executor(), on_file_done, on_done, download)
+        else:
+            batch = DownloadBatch(ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download"),
+                                  on_file_done, on_done, download, owns_executor=True)
+        self.download_batches.append(batch)
+        for att_id, file_name, save_dir in files:
+            row = self.downloads_table.insert("", "end", values=(file_name, "", "Queued"))
+            self.download_rows[row] = {"name": file_name, "done": 0, "total": None, "status": "Queued",
+                                       "att_id": att_id, "path": os.path.join(save_dir, file_name)}
+            batch.submit(row, self._download_worker, batch, row, att_id, file_name, save_dir)
+        self.update_download_totals()
+        if not files and on_done:
+            on_done()
+
+    def transfer_executor(self):
+        """Return the pool every transfer batch shares, so concurrent batches never exceed its size.
+
+        A changed Parallel transfers setting takes effect once no transfer is running.
+        """
+        try:
+            workers = max(1, min(MAX_DOWNLOAD_WORKERS, self.download_workers.get()))
+        except TclError:  # Spinbox left empty or non-numeric
+            workers = DOWNLOAD_WORKERS
+        idle = not any(batch.pending for batch in self.download_batches)
+        if self.transfer_pool is None or (workers != self.transfer_pool_size and idle):
+            if self.transfer_pool is not None:
+                self.transfer_pool.shutdown(wait=False)
+            self.transfer_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer")
+            self.transfer_pool_size = workers
+        return self.transfer_pool
+
+    def _download_worker(self, batch, row, att_id, file_name, save_dir):
+        last = {"time": 0.0, "done": None, "total": None}
+
+        def progress(done, total):
+            last.update(done=done, total=total)
+            now = time.monotonic()
+            if now - last["time"] >= DOWNLOAD_PROGRESS_MS / 1000:
+                last["time"] = now
+                run_on_ui_thread(self.update_download_row, batch, row, done, total, "Downloading")
+
+        if batch.cancelled.is_set():
+            status = "Cancelled"
+        else:
+            run_on_ui_thread(self.update_download_row, batch, row, 0, None, "Downloading")
+            try:
+                status = batch.download(att_id, file_name, save_dir, progress, batch.cancelled)
+            except Exception as e:  # The row must still finish, or the batch never reaches on_done
+                logging.exception(f"Transfer of {file_name} failed")
+                notify("error", "Transfer", f"{file_name}: {e}")
+                status = "Failed"
+        run_on_ui_thread(self.update_download_row, batch, row, last["done"], last["total"], status)
+
+    def update_download_row(self, batch, row, done, total, status):
+        state = self.download_rows.get(row)
+        if state is None or state["status"] in ("Done", "Failed", "Cancelled"):
+            return
+        if done is not None:
+            state["done"], state["total"] = done, total
+        state["status"] = status
+        if status in ("Done", "Failed", "Cancelled"):
+            batch.pending.discard(row)
+            if status == "Done" and state["total"] is None:
+                state["total"] = state["done"]
+        if self.downloads_window is not None and self.downloads_window.winfo_exists():
+            self.downloads_table.item(row, values=(state["name"], self.format_download_progress(state), status))
+            self.update_download_totals()
+        if status in ("Done", "Failed", "Cancelled"):
+            if batch.on_file_done:
+                batch.on_file_done(state["att_id"], state["path"], status, state["done"])
+            if not batch.pending and batch.on_done:
+                batch.on_done()
+
+    @staticmethod
+    def format_download_progress(state):
+        done_mb = state["done"] / 1048576
+        if not state["total"]:
+            return f"{done_mb:.1f} MB" if state["done"] else ""
+        fraction = min(1.0, state["done"] / state["total"])
+        bar = "\u2588" * round(fraction * 10) + "\u2591" * (10 - round(fraction * 10))
+        return f"{bar} {fraction:4.0%}  {done_mb:.1f} / {state['total'] / 1048576:.1f} MB"
+
+    def update_download_totals(self):
+        rows = self.download_rows.values()
+        finished = sum(1 for state in rows if state["status"] in ("Done", "Failed", "Cancelled"))
+        progress = sum(1.0 if state["status"] in ("Done", "Failed", "Cancelled") else
+                       min(1.0, state["done"] / state["total"]) if state["total"] else 0.0 for state in rows)
+        failed = sum(1 for state in rows if state["status"] == "Failed")
+        self.downloads_progress["value"] = 100 * progress / len(rows) if rows else 0
+        text = f"{finished}/{len(rows)} files, {sum(state['done'] for state in rows) / 1048576:.1f} MB"
+        self.downloads_status.configure(text=f"{text}, {failed} failed" if failed else text)
+
+    def cancel_transfers(self):
+        """Cancel button: stop every transfer and drop queued uploads (closing the app keeps them instead)."""
+        self.upload_queue.clear()
+        self.cancel_downloads()
+
+    def close_app(self):
+        """Close button and window close: stop transfers while the Transfers window still exists, then exit."""
+        self.cancel_downloads()
+        if self.transfer_pool is not None:
+            self.transfer_pool.shutdown(wait=False)
+        self.root.destroy()
+
+    def cancel_downloads(self):
+        self.dispatcher.cancel("export")
+        for batch in self.download_batches:
+            batch.cancel()
+            for row in list(batch.pending):
+                if self.download_rows[row]["status"] == "Queued":  # Never started, so no worker will report it
+                    self.update_download_row(batch, row, None, None, "Cancelled")
+
+    def show_downloads(self):
+        if self.downloads_window is not None and self.downloads_window.winfo_exists():
+            self.downloads_window.lift()
+            return
+        self.downloads_window = Toplevel(self.root)
+        self.downloads_window.title("Transfers")
+        self.downloads_window.geometry("900x400")
+        frame = tb.Frame(self.downloads_window, padding="10")
+        frame.pack(fill="both", expand=True)
+        header = tb.Frame(frame)
+        header.pack(fill="x", pady=(0, 8))
+        tb.Label(header, text="Parallel transfers:").pack(side="left")
+        tb.Spinbox(header, from_=1, to=MAX_DOWNLOAD_WORKERS, width=4,
+                   textvariable=self.download_workers).pack(side="left", padx=(5, 15))
+        self.downloads_progress = tb.Progressbar(header, maximum=100, bootstyle="success")
+        self.downloads_progress.pack(side="left", fill="x", expand=True)
+        self.downloads_status = tb.Label(header, text="", width=32, anchor="e")
+        self.downloads_status.pack(side="left", padx=(10, 0))
+        table_frame = tb.Frame(frame)
+        table_frame.pack(fill="both", expand=True)
+        self.downloads_table = self.create_table_with_scrollbars(
+            table_frame,
+            columns=("file", "progress", "status"),
+            column_widths=[400, 300, 100],
+            stretch_columns=["file"]
+        )
+        tb.Button(frame, text="Cancel", command=self.cancel_transfers, bootstyle="danger").pack(anchor="e", pady=(8, 0))
+        for row, state in self.download_rows.items():
+            self.downloads_table.insert("", "end", iid=row, values=(state["name"], self.format_download_progress(state),
+                                                                    state["status"]))
+        self.update_download_totals()
 
     def download_selected_package_attachments(self):
         self.download_attachments(self.package_attachments, self.package_attachment_table, selection_only=True)
@@ -1113,51 +3488,369 @@ class StratusGUI:
     def download_all_assembly_attachments(self):
         self.download_attachments(self.assembly_attachments, self.assembly_attachment_table, selection_only=False)
 
-    def download_attachment(self, att_id, file_name, save_dir):
+    def download_attachment(self, att_id, file_name, save_dir, progress=None, cancelled=None, store=True):
+        """Stream one attachment to save_dir; return "Done", "Failed" or "Cancelled".
+
+        Runs on a download worker. Bytes go to a .part file that later attempts (and
+        later downloads of the same file) resume with a Range request. Attachments
+        already in the attachment store are placed from there without a request;
+        store=False keeps new downloads out of it. progress(done, total) is called
+        after each chunk; total is None when the size is unknown.
+        """
+        save_path = os.path.join(save_dir, file_name)
         try:
-            with requests.get(f"{BASE_URL}/v1/attachment/{att_id}/download",
-                              headers=self.headers, stream=True, timeout=10) as response:
+            size = self.attachment_store.checkout(att_id, save_path)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Attachment store lookup failed for {file_name}: {e}")
+            size = None
+        if size is not None:
+            if progress:
+                progress(size, size)
+            return "Done"
+        part = PartialDownload(save_path, att_id)
+
+        def attempt():
+            """One request, resuming from whatever the .part file already holds."""
+            with self.client.request("GET", f"{BASE_URL}/v1/attachment/{att_id}/download",
+                                     headers=part.request_headers(), stream=True) as response:
+                if response.status_code == 416:  # Stale .part longer than the file; start over
+                    part.discard()
+                    raise RequestException("the server rejected the resume range")
                 response.raise_for_status()
-                save_path = os.path.join(save_dir, file_name)
-                with open(save_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                f, done, total = part.open(response)
+                with f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if cancelled is not None and cancelled.is_set():
+                            return "Cancelled"  # The .part file is kept for the next attempt
                         if chunk:
                             f.write(chunk)
-        except (RequestException, OSError) as e:
-            messagebox.showerror("Error", f"Failed to download/save attachment {file_name}: {e}")
+                            done += len(chunk)
+                            if progress:
+                                progress(done, total)
+            part.finish()
+            if not store:
+                return "Done"
+            try:
+                self.attachment_store.add(att_id, save_path)
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"Could not add {file_name} to the attachment store: {e}")
+            return "Done"
+
+        try:
+            status, error = run_transfer(attempt, DOWNLOAD_RETRIES, cancelled)
+        except (OSError, ValueError) as e:  # Disk errors and bad responses are not retried
+            status, error = "Failed", e
+        if status == "Failed":
+            notify("error", "Download", f"Failed to download/save attachment {file_name}: {error}")
+        return status
+
+    def export_project(self):
+        """Download every package and assembly attachment of the project into project/package/assembly folders."""
+        project_id = self.current_project_id()
+        if not project_id:
+            messagebox.showwarning(NO_PROJECT_SELECTED, "Please select a project to export.")
+            return
+        if not self.all_packages:
+            messagebox.showwarning("No Packages", "The project's packages have not been loaded yet.")
+            return
+        base_dir = filedialog.askdirectory(title="Select Export Directory")
+        if not base_dir:
+            return
+        project_name = self.projects[self.project_dropdown.current() - 1].get("name") or project_id
+        export_dir = os.path.join(base_dir, safe_filename(project_name))
+        packages = list(self.all_packages)
+        started = time.monotonic()
+        notify("info", "Project export", f"Listing attachments for {len(packages)} packages...")
+
+        def prepare(listing):
+            """Runs on a worker: skip files already exported and create the folders of the rest."""
+            files, failed_listings = listing
+            manifest = ExportManifest(os.path.join(export_dir, EXPORT_MANIFEST_FILE), project_id)
+            manifest.failed_listings = failed_listings
+            pending = []
+            skipped = 0
+            for att_id, file_name, folder in files:
+                save_dir = os.path.join(export_dir, folder)
+                if manifest.is_done(att_id, os.path.join(save_dir, file_name)):
+                    skipped += 1
+                    continue
+                os.makedirs(save_dir, exist_ok=True)
+                manifest.record(att_id, os.path.join(save_dir, file_name), "Queued")
+                pending.append((att_id, file_name, save_dir))
+            manifest.save()
+            return manifest, pending, skipped
+
+        def prepared(result):
+            manifest, pending, skipped = result
+            failed_listings = len(manifest.failed_listings)
+            if failed_listings:
+                notify("warning", "Project export", f"{failed_listings} listings failed; their files are not "
+                                                    "included. Run the export again to fetch them.")
+            counts = {"Done": 0, "Failed": 0, "Cancelled": 0, "bytes": 0}
+
+            def file_done(att_id, path, status, size):
+                manifest.record(att_id, path, status, size)
+                counts[status] += 1
+                if status == "Done":
+                    counts["bytes"] += size
+                    if counts["Done"] % 25 == 0:  # Checkpoint so a crash loses little progress
+                        manifest.save()
+
+            def done():
+                elapsed = time.monotonic() - started
+                megabytes = counts["bytes"] / 1048576
+                summary = (f"{counts['Done']} files ({megabytes:.1f} MB) in {elapsed:.0f}s, "
+                           f"{megabytes / max(elapsed, 0.001):.1f} MB/s; {skipped} already exported, "
+                           f"{counts['Failed']} failed, {counts['Cancelled']} cancelled, "
+                           f"{failed_listings} listings failed")
+                manifest.save(summary)
+                notify("info", "Project export", summary)
+                messagebox.showinfo("Export Complete", f"{project_name}: {summary}")
+
+            # A whole project would write every file twice and flush the store's recently used files
+            self.start_downloads(pending, on_file_done=file_done, on_done=done,
+                                 download=lambda *args: self.download_attachment(*args, store=False))
+
+        def listed(listing):
+            self.dispatcher.submit("export", prepare, listing, on_success=prepared, on_error=prepare_failed)
+
+        def prepare_failed(e):
+            notify("error", "Project export", f"Failed to prepare {export_dir}: {e}")
+
+        def failed(e):
+            notify("error", "Project export", f"Failed to list project attachments: {e}")
+
+        self.dispatcher.submit_async("export", self.list_project_attachments, packages,
+                                     on_success=listed, on_error=failed)
+
+    async def list_project_attachments(self, packages):
+        """Return ([(att_id, file_name, folder)], failed_listings) for the packages and their assemblies.
+
+        A listing that fails is left out and reported in failed_listings as
+        {"folder", "listing", "error"} instead of failing the whole export.
+        """
+        semaphore = asyncio.Semaphore(EXPORT_LISTING_CONCURRENCY)
+        attachment_params = {"include": "id,fileName", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
+        assembly_params = {"include": "id,name", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
+        failed_listings = []
+
+        async def listing(url, params, action, folder):
+            async with semaphore:
+                try:
+                    return [item async for item in self.async_client.paginate(url, params, action, raise_errors=True)]
+                except (RequestException, ValueError) as e:
+                    logging.warning(f"{action} for {folder} failed: {e}")
+                    failed_listings.append({"folder": folder, "listing": action, "error": str(e)})
+                    return []
+
+        def folder_names(items):
+            used = set()
+            names = []
+            for item in items:
+                name = safe_filename(item.get("name") or item.get("id", ""))
+                if name.lower() in used:  # Duplicate names get their id appended
+                    name = f"{name} ({item.get('id', '')})"
+                used.add(name.lower())
+                names.append(name)
+            return names
+
+        def attachment_files(attachments, folder, used=None):
+            used = set() if used is None else used  # Same-named attachments must not share a path
+            return [(att.get("id", ""), unique_filename(att.get("fileName") or f"attachment_{att.get('id', '')}", used),
+                     folder) for att in attachments if att.get("id")]
+
+        async def package_files(package, folder):
+            package_id = package.get("id")
+            attachments, assemblies = await asyncio.gather(
+                listing(f"{BASE_URL}/v1/package/{package_id}/attachments", attachment_params,
+                        "Fetch package attachments", folder),
+                listing(f"{BASE_URL}/v2/package/{package_id}/assemblies", assembly_params, "Fetch assemblies", folder))
+            assembly_folders = folder_names(assemblies)
+            files = attachment_files(attachments, folder, {name.lower() for name in assembly_folders})
+            assembly_attachments = await asyncio.gather(*(
+                listing(f"{BASE_URL}/v1/assembly/{assembly.get('id')}/attachments", attachment_params,
+                        "Fetch assembly attachments", os.path.join(folder, name))
+                for assembly, name in zip(assemblies, assembly_folders)))
+            for name, attachments in zip(assembly_folders, assembly_attachments):
+                files += attachment_files(attachments, os.path.join(folder, name))
+            return files
+
+        results = await asyncio.gather(*(package_files(package, folder)
+                                         for package, folder in zip(packages, folder_names(packages))))
+        return [file for files in results for file in files], failed_listings
 
     def browse_package_file(self):
-        file_path = filedialog.askopenfilename(title="Select File to Upload")
-        if file_path:
-            self.package_upload_var.set(file_path)
+        self.set_upload_files(self.package_upload_var, filedialog.askopenfilenames(title="Select Files to Upload"))
 
     def browse_assembly_file(self):
-        file_path = filedialog.askopenfilename(title="Select File to Upload")
-        if file_path:
-            self.assembly_upload_var.set(file_path)
+        self.set_upload_files(self.assembly_upload_var, filedialog.askopenfilenames(title="Select Files to Upload"))
+
+    @staticmethod
+    def set_upload_files(file_var, file_paths):
+        if not file_paths:
+            return
+        file_var._paths = list(file_paths)
+        file_var.set(file_paths[0] if len(file_paths) == 1 else
+                     f"{len(file_paths)} files: " + ", ".join(os.path.basename(path) for path in file_paths))
 
-    def upload_attachment(self, endpoint: str, file_var: StringVar, refresh_callback: callable) -> None:
-        file_path = file_var.get()
-        if not file_path or not os.path.exists(file_path):
+    def upload_attachment(self, endpoint: str, file_var: StringVar, cache_key) -> None:
+        file_paths = getattr(file_var, "_paths", None) or ([file_var.get()] if file_var.get() else [])
+        if not file_paths or not all(os.path.exists(path) for path in file_paths):
             messagebox.showwarning(NO_FILE_SELECTED, "Please select a valid file to upload.")
             return
-        try:
-            with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f)}
-                response = requests.post(endpoint, headers=self.headers, files=files, timeout=10)
+        file_var._paths = []
+        file_var.set("")
+        self.queue_uploads(endpoint, file_paths, cache_key)
+
+    def queue_uploads(self, endpoint, paths, cache_key):
+        """Add files, and every file inside folders, to the persistent upload queue and start them."""
+        file_paths = []
+        for path in paths:
+            if os.path.isdir(path):
+                for folder, _, names in os.walk(path):
+                    file_paths += [os.path.join(folder, name) for name in sorted(names)]
+            elif os.path.isfile(path):
+                file_paths.append(path)
+        if not file_paths:
+            messagebox.showwarning(NO_FILE_SELECTED, "No files found to upload.")
+            return
+        if self.upload_skip_unchanged.get():
+            self.queue_changed_uploads(endpoint, file_paths, cache_key)
+            return
+        entry_ids = [self.upload_queue.add(endpoint, path, cache_key) for path in file_paths]
+        self.upload_queue.save()
+        self.start_uploads(entry_ids)
+
+    def queue_changed_uploads(self, endpoint, file_paths, cache_key):
+        """Sync-upload: queue only files whose name is not attached yet or whose content differs.
+
+        A file counts as unchanged when an attachment with its name exists and its
+        SHA-256 matches the upload manifest or the locally stored copy of that
+        attachment. Hashes in the manifest are reused while size and mtime match.
+        """
+        kind, target_id = cache_key
+        known = self.upload_manifest.files(cache_key)
+        params = {"include": "id,fileName", "page": 0, "pagesize": PAGE_SIZE, "disabletotal": True}
+
+        def compare():
+            attachments = list(self.paginated_api_fetch(f"{BASE_URL}/v1/{kind}/{target_id}/attachments", params,
+                                                        "Fetch attachments", raise_errors=True))
+            attached = {}
+            for att in attachments:
+                attached.setdefault(att.get("fileName", ""), []).append(att.get("id"))
+            changed, unchanged = [], []
+            for path in file_paths:
+                stat = os.stat(path)
+                name = os.path.basename(path)
+                entry = known.get(name)
+                if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                    sha256 = entry["sha256"]
+                else:
+                    sha256 = file_sha256(path)
+                if name in attached and ((entry and entry["sha256"] == sha256) or
+                                         sha256 in {self.attachment_store.sha256(att_id) for att_id in attached[name]}):
+                    unchanged.append((path, stat, sha256))
+                else:
+                    changed.append((path, stat, sha256))
+            return changed, unchanged
+
+        def compared(result):
+            changed, unchanged = result
+            for path, stat, sha256 in unchanged:  # Refresh mtimes so they are not hashed again next time
+                self.upload_manifest.record(cache_key, os.path.basename(path), stat.st_size, stat.st_mtime, sha256)
+            self.upload_manifest.save()
+            notify("info", "Sync upload", f"{len(changed)} new or changed, {len(unchanged)} unchanged files skipped")
+            if not changed:
+                messagebox.showinfo("Sync Upload", "All files are already up to date.")
+                return
+            entry_ids = []
+            for path, stat, sha256 in changed:
+                entry_id = self.upload_queue.add(endpoint, path, cache_key)
+                self.upload_queue.entries[entry_id].update(size=stat.st_size, mtime=stat.st_mtime, sha256=sha256)
+                entry_ids.append(entry_id)
+            self.upload_queue.save()
+            self.start_uploads(entry_ids)
+
+        def failed(e):
+            notify("error", "Sync upload", f"Failed to compare files with the attachment listing: {e}")
+
+        self.dispatcher.submit(None, compare, on_success=compared, on_error=failed)
+
+    def start_uploads(self, entry_ids):
+        """Upload queued entries on the transfer pool; listings refresh once when the queue is empty."""
+        if not entry_ids:
+            return
+        queue_entries = self.upload_queue.entries
+
+        def upload(entry_id, file_name, folder, progress, cancelled):
+            return self.upload_file(queue_entries[entry_id]["endpoint"], os.path.join(folder, file_name),
+                                    progress, cancelled)
+
+        def file_done(entry_id, path, status, size):
+            entry = self.upload_queue.entries.get(entry_id)
+            if entry is None or status == "Cancelled":
+                return  # Kept in the queue when the app is closing; already dropped by the Cancel button
+            if status == "Done":
+                self.uploaded_cache_keys.add(entry["cache_key"])
+                self.uploaded_count += 1
+                if entry.get("sha256"):
+                    self.upload_manifest.record(entry["cache_key"], os.path.basename(entry["path"]),
+                                                entry["size"], entry["mtime"], entry["sha256"])
+                    self.upload_manifest.save()
+            self.upload_queue.remove(entry_id)
+
+        def uploaded():
+            if not self.upload_queue.entries:
+                self.upload_queue_drained()
+
+        entries = [(entry_id, queue_entries[entry_id]) for entry_id in entry_ids]
+        self.start_downloads([(entry_id, os.path.basename(entry["path"]), os.path.dirname(entry["path"]))
+                              for entry_id, entry in entries], on_file_done=file_done, on_done=uploaded, download=upload)
+
+    def upload_queue_drained(self):
+        cache_keys, self.uploaded_cache_keys = self.uploaded_cache_keys, set()
+        count, self.uploaded_count = self.uploaded_count, 0
+        if not count:
+            return
+        for cache_key in cache_keys:
+            self.attachment_cache.invalidate(cache_key)
+        if ("package", self.selected_package_id) in cache_keys:
+            self.fetch_package_attachments()
+        if ("assembly", self.selected_assembly_id) in cache_keys:
+            self.fetch_assembly_attachments(None)
+        messagebox.showinfo("Success", f"Successfully uploaded {count} file{'s' if count != 1 else ''}")
+
+    def upload_file(self, endpoint, file_path, progress=None, cancelled=None):
+        """Stream one file to endpoint as multipart/form-data; return "Done", "Failed" or "Cancelled".
+
+        Dropped connections, 429s and 5xx responses are retried up to UPLOAD_RETRIES times.
+        """
+        def attempt():
+            """One POST with a fresh body stream."""
+            body = MultipartFileStream(file_path, progress=progress, cancelled=cancelled)
+            try:
+                timeout = (CONNECT_TIMEOUT, READ_TIMEOUT + len(body) / UPLOAD_MIN_BYTES_PER_SECOND)
+                response = self.client.request("POST", endpoint, data=body, timeout=timeout,
+                                               headers={"Content-Type": body.content_type})
                 response.raise_for_status()
-                messagebox.showinfo("Success", f"Successfully uploaded {os.path.basename(file_path)}")
-                file_var.set("")
-                refresh_callback()
-        except (RequestException, OSError) as e:
-            messagebox.showerror("Error", f"Failed to upload attachment: {e}")
+                return "Done"
+            finally:
+                body.close()
+
+        try:
+            status, error = run_transfer(attempt, UPLOAD_RETRIES, cancelled)
+        except OSError as e:  # Unreadable file, or the body stream stopped by Cancel
+            status, error = "Cancelled" if cancelled is not None and cancelled.is_set() else "Failed", e
+        if status == "Failed":
+            notify("error", "Upload", f"Failed to upload attachment {os.path.basename(file_path)}: {error}")
+        return status
 
     def upload_package_attachment(self):
         if not self.selected_package_id:
             messagebox.showwarning(NO_PACKAGE_SELECTED, "Please select a package to upload an attachment.")
             return
         endpoint = f"{BASE_URL}/v1/package/{self.selected_package_id}/attachment"
-        self.upload_attachment(endpoint, self.package_upload_var, self.fetch_package_attachments)
+        self.upload_attachment(endpoint, self.package_upload_var, ("package", self.selected_package_id))
 
     def upload_assembly_attachment(self):
         selected = self.assembly_table.selection()
@@ -1166,58 +3859,104 @@ class StratusGUI:
             return
         assembly_id = self.assembly_table.item(selected[0])["tags"][0]
         endpoint = f"{BASE_URL}/v1/assembly/{assembly_id}/attachment"
-        self.upload_attachment(endpoint, self.assembly_upload_var, lambda: self.fetch_assembly_attachments(None))
+        self.upload_attachment(endpoint, self.assembly_upload_var, ("assembly", assembly_id))
+
+    def upload_package_folder(self):
+        folder = filedialog.askdirectory(title="Select Folder to Upload") if self.selected_package_id else None
+        self.drop_package_files([folder] if folder else [])
+
+    def upload_assembly_folder(self):
+        folder = filedialog.askdirectory(title="Select Folder to Upload") if self.selected_assembly_id else None
+        self.drop_assembly_files([folder] if folder else [])
+
+    def drop_package_files(self, paths):
+        if not self.selected_package_id:
+            messagebox.showwarning(NO_PACKAGE_SELECTED, "Please select a package to upload attachments.")
+            return
+        if paths:
+            self.queue_uploads(f"{BASE_URL}/v1/package/{self.selected_package_id}/attachment", paths,
+                               ("package", self.selected_package_id))
+
+    def drop_assembly_files(self, paths):
+        if not self.selected_assembly_id:
+            messagebox.showwarning(NO_ASSEMBLY_SELECTED, "Please select an assembly to upload attachments.")
+            return
+        if paths:
+            self.queue_uploads(f"{BASE_URL}/v1/assembly/{self.selected_assembly_id}/attachment", paths,
+                               ("assembly", self.selected_assembly_id))
+
+    def register_drop_target(self, widget, on_drop):
+        """Accept files and folders dropped onto widget when tkinterdnd2 is installed."""
+        if TkinterDnD is None:
+            return
+        try:
+            TkinterDnD._require(self.root)  # Loads tkdnd into the existing ttkbootstrap window
+            widget.drop_target_register(DND_FILES)
+        except Exception as e:
+            logging.warning(f"Drag and drop unavailable: {e}")
+            return
+
+        def drop(event):
+            on_drop(list(widget.tk.splitlist(event.data)))
+            return event.action
+
+        widget.dnd_bind("<<Drop>>", drop)
 
     def refresh_tables(self):
-        project_index = self.project_dropdown.current()
-        project_filter_text = self.project_filter.get()
-        package_filter_text = self.package_filter.get()
-        selected_package_id = self.selected_package_id
-        assembly_filter_text = self.assembly_filter.get()
-        selected_assembly_id = self.selected_assembly_id
-        current_tab = self.notebook.index(self.notebook.select())
-        self.fetch_projects()
-        self.project_filter.delete(0, tb.END)
-        self.project_filter.insert(0, project_filter_text)
-        self.filter_items("projects")
-        if project_index >= 0 and project_index < len(self.project_dropdown["values"]):
-            self.project_dropdown.current(project_index)
-            if project_index > 0:
-                project_id = self.projects[project_index - 1].get("id")
-                self.fetch_packages_by_id(project_id)
-                self.package_filter.delete(0, tb.END)
-                self.package_filter.insert(0, package_filter_text)
-                self.filter_items("packages")
-                if selected_package_id:
-                    for item in self.package_table.get_children():
-                        if self.package_table.item(item)["tags"][0] == selected_package_id:
-                            self.package_table.selection_set(item)
-                            self.selected_package_id = selected_package_id
-                            self.fetch_package_attachments()
-                            self.fetch_assemblies()
-                            self.assembly_filter.delete(0, tb.END)
-                            self.assembly_filter.insert(0, assembly_filter_text)
-                            self.filter_items("assemblies")
-                            self.update_properties_fields()
-                            if selected_assembly_id:
-                                for item in self.assembly_table.get_children():
-                                    if self.assembly_table.item(item)["tags"][0] == selected_assembly_id:
-                                        self.assembly_table.selection_set(item)
-                                        self.fetch_assembly_attachments(None)
-                                        break
-        self.fetch_activity_logs()
-        self.fetch_users()
-        self.fetch_containers()
-        self.fetch_health()
-        self.fetch_tracking_statuses()
-        self.notebook.select(current_tab)
-
-    def paginated_api_fetch(self, url: str, params: dict, action: str):
+        """Re-fetch the visible tab and the selected project/package/assembly chain.
+
+        Other tabs are marked stale and reload when next opened. Rows are merged into
+        the existing tables by id, so selections survive the refresh.
+        """
+        project_id = self.current_project_id()
+        package_id = self.selected_package_id
+        assembly_id = self.selected_assembly_id
+        self.attachment_cache.clear()
+        for tab_key in self.tab_data_fetched:
+            if self.tab_data_fetched[tab_key]:
+                self.tab_data_fetched[tab_key] = False
+                self.stale_tabs.add(tab_key)
+        self.on_tab_changed(None)
+
+        # Each step runs once the previous fetch has landed on the Tk thread
+        def assemblies_loaded():
+            self.assemblies = self.filter_source("assemblies", self.get_filter_text("assemblies"))
+            self.update_table("assemblies", on_done=assemblies_shown)
+
+        def assemblies_shown():
+            if assembly_id and self.select_table_row(self.assembly_table, assembly_id):
+                self.fetch_assembly_attachments(None)
+            else:
+                self.clear_table(self.assembly_attachment_table)
+                self.assembly_no_attachments_label.place_forget()
+                self.selected_assembly_id = None
+
+        def packages_loaded():
+            if package_id and self.select_table_row(self.package_table, package_id):
+                self.selected_assembly_id = None
+                self.on_package_select(None, on_assemblies_loaded=assemblies_loaded)
+            elif package_id:
+                self.clear_tables_and_fields()
+                self.update_table("packages")
+
+        def projects_loaded():
+            self.projects = self.filter_source("projects", self.get_filter_text("projects"))
+            self.project_dropdown["values"] = ["Choose Project"] + [p.get("name", "Unnamed") for p in self.projects]
+            project_ids = [p.get("id") for p in self.projects]
+            if project_id in project_ids:
+                self.project_dropdown.current(project_ids.index(project_id) + 1)
+                self.fetch_packages_by_id(project_id, on_loaded=packages_loaded, merge=True)
+            elif project_id:
+                self.clear_tables_and_fields()
+
+        self.fetch_projects(on_loaded=projects_loaded, revalidate=True)
+
+    def paginated_api_fetch(self, url: str, params: dict, action: str, raise_errors=False):
         page = 0
-        while True:
+        while not job_cancelled():
             params["page"] = page
             try:
-                response = make_api_request(url, self.headers, params, action)
+                response = self.client.get(url, params, action)
                 data = response.json()
                 items = data.get("data", [])
                 yield from items
@@ -1225,6 +3964,8 @@ class StratusGUI:
                     break
                 page += 1
             except RequestException:
+                if raise_errors:
+                    raise
                 break
 
 if __name__ == "__main__":
@@ -1244,4 +3985,10 @@ if __name__ == "__main__":
     root.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
     app = StratusGUI(root)
+    root.protocol("WM_DELETE_WINDOW", app.close_app)
     root.mainloop()
+    app.async_client.close()
+    app.dispatcher.shutdown()
+    app.client.close()
+    app.package_store.close()
+    app.attachment_store.close()